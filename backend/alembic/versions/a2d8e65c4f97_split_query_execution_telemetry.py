@@ -0,0 +1,66 @@
+"""Split query execution telemetry into query_executions
+
+Revision ID: a2d8e65c4f97
+Revises: f1b6c93e8d52
+Create Date: 2026-08-30 11:49:44.201358
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2d8e65c4f97'
+down_revision: Union[str, None] = 'f1b6c93e8d52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('query_executions',
+    sa.Column('query_id', sa.UUID(), nullable=False),
+    sa.Column('execution_time_ms', sa.Float(), nullable=True),
+    sa.Column('result_rows_count', sa.Integer(), nullable=True),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['query_id'], ['queries.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('query_id')
+    )
+    # Move existing telemetry across before narrowing the hot table
+    op.execute(
+        """
+        INSERT INTO query_executions
+            (id, query_id, execution_time_ms, result_rows_count, error_message,
+             created_at, updated_at)
+        SELECT gen_random_uuid(), id, execution_time_ms, result_rows_count,
+               error_message, created_at, updated_at
+        FROM queries
+        WHERE execution_time_ms IS NOT NULL
+           OR result_rows_count IS NOT NULL
+           OR error_message IS NOT NULL
+        """
+    )
+    op.drop_column('queries', 'execution_time_ms')
+    op.drop_column('queries', 'result_rows_count')
+    op.drop_column('queries', 'error_message')
+
+
+def downgrade() -> None:
+    op.add_column('queries', sa.Column('execution_time_ms', sa.Float(), nullable=True))
+    op.add_column('queries', sa.Column('result_rows_count', sa.Integer(), nullable=True))
+    op.add_column('queries', sa.Column('error_message', sa.Text(), nullable=True))
+    op.execute(
+        """
+        UPDATE queries q
+        SET execution_time_ms = e.execution_time_ms,
+            result_rows_count = e.result_rows_count,
+            error_message = e.error_message
+        FROM query_executions e
+        WHERE e.query_id = q.id
+        """
+    )
+    op.drop_table('query_executions')
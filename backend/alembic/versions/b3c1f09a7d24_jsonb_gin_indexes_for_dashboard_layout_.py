@@ -0,0 +1,57 @@
+"""JSONB GIN indexes for dashboard layout and widget config
+
+Revision ID: b3c1f09a7d24
+Revises: e7df42685fc0
+Create Date: 2026-08-30 10:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3c1f09a7d24'
+down_revision: Union[str, None] = 'e7df42685fc0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # JSON -> JSONB so the columns support indexed @> containment
+    op.alter_column(
+        'dashboards', 'layout',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using='layout::jsonb',
+    )
+    op.alter_column(
+        'dashboard_widgets', 'config',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using='config::jsonb',
+    )
+    # jsonb_path_ops GIN indexes: ~5x smaller than default jsonb_ops,
+    # supports the @> operator used for layout/config lookups
+    op.execute(
+        'CREATE INDEX ix_dashboards_layout_gin '
+        'ON dashboards USING GIN (layout jsonb_path_ops)'
+    )
+    op.execute(
+        'CREATE INDEX ix_dashboard_widgets_config_gin '
+        'ON dashboard_widgets USING GIN (config jsonb_path_ops)'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_dashboard_widgets_config_gin', table_name='dashboard_widgets')
+    op.drop_index('ix_dashboards_layout_gin', table_name='dashboards')
+    op.alter_column(
+        'dashboard_widgets', 'config',
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        postgresql_using='config::json',
+    )
+    op.alter_column(
+        'dashboards', 'layout',
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        postgresql_using='layout::json',
+    )
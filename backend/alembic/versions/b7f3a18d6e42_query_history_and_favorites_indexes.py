@@ -0,0 +1,31 @@
+"""Query history pagination and favorites indexes
+
+Revision ID: b7f3a18d6e42
+Revises: a2d8e65c4f97
+Create Date: 2026-08-30 12:03:27.655281
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7f3a18d6e42'
+down_revision: Union[str, None] = 'a2d8e65c4f97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        'CREATE INDEX ix_queries_user_created ON queries (user_id, created_at DESC)'
+    )
+    op.execute(
+        'CREATE INDEX ix_queries_favorites ON queries (user_id) WHERE is_favorite'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_queries_favorites', table_name='queries')
+    op.drop_index('ix_queries_user_created', table_name='queries')
@@ -0,0 +1,31 @@
+"""Encrypted password as BYTEA
+
+Revision ID: c4a9f27e8b53
+Revises: b7f3a18d6e42
+Create Date: 2026-08-30 12:21:55.087316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a9f27e8b53'
+down_revision: Union[str, None] = 'b7f3a18d6e42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE data_sources ALTER COLUMN encrypted_password TYPE bytea "
+        "USING convert_to(encrypted_password, 'UTF8')"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE data_sources ALTER COLUMN encrypted_password TYPE text "
+        "USING convert_from(encrypted_password, 'UTF8')"
+    )
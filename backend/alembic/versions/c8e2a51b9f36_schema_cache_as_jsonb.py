@@ -0,0 +1,34 @@
+"""Schema cache as JSONB
+
+Revision ID: c8e2a51b9f36
+Revises: b3c1f09a7d24
+Create Date: 2026-08-30 10:31:07.482910
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e2a51b9f36'
+down_revision: Union[str, None] = 'b3c1f09a7d24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'data_sources', 'schema_cache',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using='schema_cache::jsonb',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'data_sources', 'schema_cache',
+        type_=sa.Text(),
+        postgresql_using='schema_cache::text',
+    )
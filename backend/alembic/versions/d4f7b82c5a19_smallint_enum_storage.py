@@ -0,0 +1,75 @@
+"""SMALLINT storage for role and data source type enums
+
+Revision ID: d4f7b82c5a19
+Revises: c8e2a51b9f36
+Create Date: 2026-08-30 11:02:36.905173
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f7b82c5a19'
+down_revision: Union[str, None] = 'c8e2a51b9f36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE user_organizations ALTER COLUMN role TYPE smallint USING
+            CASE role::text
+                WHEN 'OWNER' THEN 1
+                WHEN 'ADMIN' THEN 2
+                WHEN 'MEMBER' THEN 3
+                WHEN 'VIEWER' THEN 4
+            END
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE data_sources ALTER COLUMN type TYPE smallint USING
+            CASE type::text
+                WHEN 'POSTGRESQL' THEN 1
+                WHEN 'MYSQL' THEN 2
+                WHEN 'SQLITE' THEN 3
+                WHEN 'CSV' THEN 4
+            END
+        """
+    )
+    op.execute("DROP TYPE IF EXISTS organizationrole")
+    op.execute("DROP TYPE IF EXISTS datasourcetype")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE TYPE organizationrole AS ENUM ('OWNER', 'ADMIN', 'MEMBER', 'VIEWER')"
+    )
+    op.execute(
+        "CREATE TYPE datasourcetype AS ENUM ('POSTGRESQL', 'MYSQL', 'SQLITE', 'CSV')"
+    )
+    op.execute(
+        """
+        ALTER TABLE user_organizations ALTER COLUMN role TYPE organizationrole USING
+            CASE role
+                WHEN 1 THEN 'OWNER'
+                WHEN 2 THEN 'ADMIN'
+                WHEN 3 THEN 'MEMBER'
+                WHEN 4 THEN 'VIEWER'
+            END::organizationrole
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE data_sources ALTER COLUMN type TYPE datasourcetype USING
+            CASE type
+                WHEN 1 THEN 'POSTGRESQL'
+                WHEN 2 THEN 'MYSQL'
+                WHEN 3 THEN 'SQLITE'
+                WHEN 4 THEN 'CSV'
+            END::datasourcetype
+        """
+    )
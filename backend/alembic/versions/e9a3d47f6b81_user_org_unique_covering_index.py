@@ -0,0 +1,32 @@
+"""Unique constraint and covering index on user_organizations
+
+Revision ID: e9a3d47f6b81
+Revises: d4f7b82c5a19
+Create Date: 2026-08-30 11:18:52.330467
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9a3d47f6b81'
+down_revision: Union[str, None] = 'd4f7b82c5a19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_unique_constraint(
+        'uq_user_org', 'user_organizations', ['user_id', 'organization_id']
+    )
+    op.execute(
+        'CREATE INDEX ix_user_org_covering ON user_organizations '
+        '(user_id, organization_id) INCLUDE (role)'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_org_covering', table_name='user_organizations')
+    op.drop_constraint('uq_user_org', 'user_organizations', type_='unique')
@@ -0,0 +1,27 @@
+"""Partial index on active user emails
+
+Revision ID: f1b6c93e8d52
+Revises: e9a3d47f6b81
+Create Date: 2026-08-30 11:27:19.764032
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1b6c93e8d52'
+down_revision: Union[str, None] = 'e9a3d47f6b81'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        'CREATE INDEX ix_users_email_active ON users (email) WHERE is_active'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_email_active', table_name='users')
@@ -2,9 +2,11 @@
 Authentication API endpoints for user registration, login, and token management.
 """
 
+import asyncio
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel, EmailStr, Field
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -40,6 +42,13 @@ class LoginRequest(BaseModel):
     password: str = Field(..., description="User password")
 
 
+# Touch validators/serializers at import so first-request latency doesn't
+# include pydantic-core schema builds (same warm-up as app.schemas)
+for _model in (Token, TokenRefresh, LoginRequest):
+    _ = (_model.__pydantic_validator__, _model.__pydantic_serializer__)
+del _model, _
+
+
 # ==================== Endpoints ====================
 
 
@@ -60,10 +69,8 @@ async def register(
     - **password**: Password (min 8 characters)
     - **full_name**: Optional full name
     """
-    auth_service = AuthService(db)
-
     # Check if email already exists
-    existing_user = await auth_service.get_user_by_email(user_in.email)
+    existing_user = await AuthService.get_user_by_email(db, user_in.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -71,8 +78,8 @@ async def register(
         )
 
     # Create user
-    user = await auth_service.create_user(user_in)
-    return UserResponse.model_validate(user)
+    user = await AuthService.create_user(db, user_in)
+    return UserResponse.from_orm_trusted(user)
 
 
 @router.post(
@@ -91,10 +98,8 @@ async def login(
     - **username**: User email (OAuth2 spec uses 'username')
     - **password**: User password
     """
-    auth_service = AuthService(db)
-
     # Authenticate user (OAuth2 form uses 'username' for email)
-    user = await auth_service.authenticate(form_data.username, form_data.password)
+    user = await AuthService.authenticate(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -108,9 +113,10 @@ async def login(
             detail="User account is inactive",
         )
 
-    # Generate tokens
-    access_token = AuthService.create_access_token(subject=user.id)
-    refresh_token = AuthService.create_refresh_token(subject=user.id)
+    # Generate both tokens in a single thread hop
+    access_token, refresh_token = await asyncio.to_thread(
+        AuthService.create_token_pair, user.id
+    )
 
     return Token(
         access_token=access_token,
@@ -134,9 +140,7 @@ async def login_json(
     - **email**: User email
     - **password**: User password
     """
-    auth_service = AuthService(db)
-
-    user = await auth_service.authenticate(login_data.email, login_data.password)
+    user = await AuthService.authenticate(db, login_data.email, login_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -150,8 +154,9 @@ async def login_json(
             detail="User account is inactive",
         )
 
-    access_token = AuthService.create_access_token(subject=user.id)
-    refresh_token = AuthService.create_refresh_token(subject=user.id)
+    access_token, refresh_token = await asyncio.to_thread(
+        AuthService.create_token_pair, user.id
+    )
 
     return Token(
         access_token=access_token,
@@ -197,8 +202,13 @@ async def refresh_token(
             detail="Invalid refresh token",
         )
 
-    auth_service = AuthService(db)
-    user = await auth_service.get_user_by_id(user_id)
+    # The new tokens only depend on the subject already in the payload, so
+    # sign them concurrently with the user lookup and discard them below if
+    # the user turns out to be missing or inactive
+    user, (access_token, refresh_token) = await asyncio.gather(
+        AuthService.get_user_by_id(db, user_id),
+        asyncio.to_thread(AuthService.create_token_pair, user_id),
+    )
 
     if not user or not user.is_active:
         raise HTTPException(
@@ -206,10 +216,6 @@ async def refresh_token(
             detail="User not found or inactive",
         )
 
-    # Generate new tokens
-    access_token = AuthService.create_access_token(subject=user.id)
-    refresh_token = AuthService.create_refresh_token(subject=user.id)
-
     return Token(
         access_token=access_token,
         refresh_token=refresh_token,
@@ -219,15 +225,21 @@ async def refresh_token(
 
 @router.get(
     "/me",
-    response_model=UserResponse,
     summary="Get current user",
 )
 async def get_current_user_info(
     current_user: CurrentUser,
-) -> UserResponse:
+) -> ORJSONResponse:
     """
     Get the currently authenticated user's information.
 
     Requires valid access token in Authorization header.
+
+    Serialized directly through UserResponse's cached pydantic-core
+    serializer, skipping FastAPI's response_model re-validation pass on
+    this hot endpoint. The row came from our own users table, so it is
+    constructed without a validation pass either.
     """
-    return UserResponse.model_validate(current_user)
+    return ORJSONResponse(
+        content=UserResponse.from_orm_trusted(current_user).model_dump(mode="json")
+    )
@@ -2,12 +2,17 @@
 Data Sources API endpoints for managing database connections.
 """
 
-from typing import List
+import asyncio
+import hashlib
+from typing import List, Optional, Union
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, status
+from pydantic import TypeAdapter
 
 from app.api.dependencies import CurrentUser, DbSession
+from app.core.cache import cache_delete, cache_get_json, cache_set_json
+from app.core.config import settings
 from app.models.data_source import DataSourceType
 from app.schemas.data_source import (
     DataSourceCreate,
@@ -21,6 +26,45 @@ from app.services.database_adapter import DataSourceService
 router = APIRouter(prefix="/data-sources", tags=["Data Sources"])
 
 
+# Validates whole result lists in one pydantic-core call instead of a
+# per-row model_validate comprehension
+_DS_LIST_ADAPTER = TypeAdapter(List[DataSourceResponse])
+
+
+# Dashboards retry connection tests within seconds; debounce the full
+# TCP + auth round-trip to the target database
+CONNECTION_TEST_CACHE_TTL = 10
+
+
+def _schema_cache_key(data_source_id: UUID) -> str:
+    """Build the Redis key for a data source's cached schema."""
+    return f"schema:{data_source_id}"
+
+
+def _conntest_cache_key(
+    type: str,
+    host: Optional[str],
+    port: Optional[int],
+    database: Optional[str],
+    username: Optional[str],
+    password: Optional[Union[bytes, str]],
+) -> str:
+    """
+    Build the Redis key for a connection test result.
+
+    The password never appears in the key — only a short digest of it, so
+    changing the password changes the key without leaking material.
+    """
+    if isinstance(password, str):
+        password = password.encode("utf-8")
+    password_digest = hashlib.blake2b(
+        password or b"", digest_size=8
+    ).hexdigest()
+    material = f"{type}|{host}|{port}|{database}|{username}|{password_digest}"
+    digest = hashlib.blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
+    return f"conntest:{digest}"
+
+
 # ==================== Schema Endpoints ====================
 
 
@@ -71,7 +115,7 @@ async def create_data_source(
         file_path=data_source_in.file_path,
     )
 
-    return DataSourceResponse.model_validate(data_source)
+    return DataSourceResponse.from_orm_trusted(data_source)
 
 
 @router.get(
@@ -91,7 +135,7 @@ async def list_data_sources(
     """
     service = DataSourceService(db)
     data_sources = await service.get_data_sources_by_org(organization_id)
-    return [DataSourceResponse.model_validate(ds) for ds in data_sources]
+    return _DS_LIST_ADAPTER.validate_python(data_sources, from_attributes=True)
 
 
 @router.get(
@@ -116,7 +160,7 @@ async def get_data_source(
             detail="Data source not found",
         )
 
-    return DataSourceResponse.model_validate(data_source)
+    return DataSourceResponse.from_orm_trusted(data_source)
 
 
 @router.patch(
@@ -134,7 +178,15 @@ async def update_data_source(
     Update a data source's configuration.
     """
     service = DataSourceService(db)
-    data_source = await service.get_data_source(data_source_id)
+
+    # Single UPDATE ... RETURNING round-trip — no preliminary fetch; the
+    # Postgres write and the Redis schema-cache drop hit different backends,
+    # so run them concurrently
+    update_data = data_source_update.model_dump(exclude_unset=True)
+    data_source, _ = await asyncio.gather(
+        service.update_data_source(data_source_id, **update_data),
+        cache_delete(_schema_cache_key(data_source_id)),
+    )
 
     if not data_source:
         raise HTTPException(
@@ -142,11 +194,7 @@ async def update_data_source(
             detail="Data source not found",
         )
 
-    # Update fields
-    update_data = data_source_update.model_dump(exclude_unset=True)
-    data_source = await service.update_data_source(data_source, **update_data)
-
-    return DataSourceResponse.model_validate(data_source)
+    return DataSourceResponse.from_orm_trusted(data_source)
 
 
 @router.delete(
@@ -163,15 +211,17 @@ async def delete_data_source(
     Delete a data source.
     """
     service = DataSourceService(db)
-    data_source = await service.get_data_source(data_source_id)
 
-    if not data_source:
+    # Single DELETE round-trip — no preliminary fetch
+    deleted = await service.delete_data_source(data_source_id)
+
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Data source not found",
         )
 
-    await service.delete_data_source(data_source)
+    await cache_delete(_schema_cache_key(data_source_id))
 
 
 @router.post(
@@ -189,6 +239,23 @@ async def test_connection(
 
     Useful for validating connection parameters before creating a data source.
     """
+    cache_key = _conntest_cache_key(
+        type=test_params.type.value,
+        host=test_params.host,
+        port=test_params.port,
+        database=test_params.database,
+        username=test_params.username,
+        password=test_params.password,
+    )
+    cached = await cache_get_json(cache_key)
+    if cached is not None:
+        return DataSourceTestResult(
+            success=cached["success"],
+            message=cached["message"],
+            latency_ms=0.0,
+            cached=True,
+        )
+
     service = DataSourceService(db)
 
     success, message, latency = await service.test_connection(
@@ -200,6 +267,12 @@ async def test_connection(
         password=test_params.password,
     )
 
+    await cache_set_json(
+        cache_key,
+        {"success": success, "message": message},
+        ttl=CONNECTION_TEST_CACHE_TTL,
+    )
+
     return DataSourceTestResult(
         success=success,
         message=message,
@@ -229,8 +302,31 @@ async def test_existing_connection(
             detail="Data source not found",
         )
 
+    cache_key = _conntest_cache_key(
+        type=data_source.type.value,
+        host=data_source.host,
+        port=data_source.port,
+        database=data_source.database,
+        username=data_source.username,
+        password=data_source.encrypted_password,
+    )
+    cached = await cache_get_json(cache_key)
+    if cached is not None:
+        return DataSourceTestResult(
+            success=cached["success"],
+            message=cached["message"],
+            latency_ms=0.0,
+            cached=True,
+        )
+
     success, message, latency = await service.test_connection(data_source=data_source)
 
+    await cache_set_json(
+        cache_key,
+        {"success": success, "message": message},
+        ttl=CONNECTION_TEST_CACHE_TTL,
+    )
+
     return DataSourceTestResult(
         success=success,
         message=message,
@@ -262,13 +358,20 @@ async def get_schema(
             detail="Data source not found",
         )
 
-    # Clear cache if refresh requested
+    cache_key = _schema_cache_key(data_source_id)
+
+    # Clear caches if refresh requested, otherwise try Redis first so
+    # repeated schema fetches skip both the remote DB and Postgres
     if refresh:
-        data_source.schema_cache = None
-        await db.flush()
+        await cache_delete(cache_key)
+    else:
+        cached_schema = await cache_get_json(cache_key)
+        if cached_schema is not None:
+            return {"data_source_id": str(data_source_id), "schema": cached_schema}
 
     try:
-        schema = await service.get_schema(data_source)
+        schema = await service.get_schema(data_source, refresh=refresh)
+        await cache_set_json(cache_key, schema, ttl=settings.SCHEMA_CACHE_TTL_SEC)
         return {"data_source_id": str(data_source_id), "schema": schema}
     except Exception as e:
         raise HTTPException(
@@ -2,13 +2,18 @@
 API dependencies for authentication and authorization.
 """
 
-from typing import Annotated
+import json
+import re
+from datetime import datetime
+from typing import Annotated, Optional
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import get_redis
+from app.core.config import settings
 from app.db.session import get_async_session
 from app.models.user import User
 from app.services.auth import AuthService
@@ -16,6 +21,82 @@ from app.services.auth import AuthService
 # OAuth2 scheme for token extraction from Authorization header
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# Cached users expire well before the access token does, so a revoked or
+# deactivated account is only served from cache briefly.
+USER_CACHE_TTL = min(300, settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+
+
+# Canonical lowercase UUID form, as produced by str(uuid.UUID) when tokens
+# are signed. A regex match is far cheaper than uuid.UUID's pure-Python
+# parser, and the string can be bound directly to the Postgres UUID column.
+_UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
+)
+
+
+def _user_cache_key(user_id: str) -> str:
+    """Build the Redis key for a cached user."""
+    return f"user:{user_id}"
+
+
+def _serialize_user(user: User) -> str:
+    """Serialize the User fields needed to rebuild it from cache."""
+    return json.dumps(
+        {
+            "id": str(user.id),
+            "email": user.email,
+            "full_name": user.full_name,
+            "is_active": user.is_active,
+            "is_superuser": user.is_superuser,
+            "created_at": user.created_at.isoformat(),
+            "updated_at": user.updated_at.isoformat(),
+        }
+    )
+
+
+def _deserialize_user(raw: str) -> User:
+    """Rebuild a detached User instance from its cached representation."""
+    data = json.loads(raw)
+    return User(
+        id=UUID(data["id"]),
+        email=data["email"],
+        full_name=data["full_name"],
+        is_active=data["is_active"],
+        is_superuser=data["is_superuser"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"]),
+    )
+
+
+async def _get_user_cached(user_id: str, db: AsyncSession) -> Optional[User]:
+    """
+    Read-through cache for user lookups keyed by the JWT subject.
+
+    On a cache hit the database is skipped entirely; on a miss the user is
+    fetched from Postgres and written back with a short TTL. Redis errors
+    degrade gracefully to a plain database lookup.
+    """
+    redis = get_redis()
+    cache_key = _user_cache_key(user_id)
+
+    try:
+        cached = await redis.get(cache_key)
+    except Exception:
+        cached = None
+
+    if cached is not None:
+        return _deserialize_user(cached)
+
+    user = await AuthService.get_user_by_id(db, user_id)
+
+    if user is not None:
+        try:
+            await redis.set(cache_key, _serialize_user(user), ex=USER_CACHE_TTL)
+        except Exception:
+            pass
+
+    return user
+
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
@@ -49,19 +130,15 @@ async def get_current_user(
     if payload.get("type") != "access":
         raise credentials_exception
 
-    # Get user ID from token
-    user_id_str: str = payload.get("sub")
-    if user_id_str is None:
-        raise credentials_exception
-
-    try:
-        user_id = UUID(user_id_str)
-    except ValueError:
+    # Get user ID from token. The string is validated with a cheap regex and
+    # bound to the UUID column as-is; asyncpg adapts it server-side, so the
+    # per-request uuid.UUID parse is skipped entirely.
+    user_id: str = payload.get("sub")
+    if user_id is None or not _UUID_RE.match(user_id):
         raise credentials_exception
 
-    # Fetch user from database
-    auth_service = AuthService(db)
-    user = await auth_service.get_user_by_id(user_id)
+    # Fetch user from cache, falling back to the database
+    user = await _get_user_cached(user_id, db)
 
     if user is None:
         raise credentials_exception
@@ -2,24 +2,58 @@
 Query API endpoints for natural language query processing.
 """
 
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query as QueryParam, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 
 from app.api.dependencies import CurrentUser, DbSession
+from app.core.cache import cache_get_json, cache_set_json, get_redis
 from app.schemas.query import (
     QueryCreate,
     QueryExecute,
     QueryExecuteResult,
     QueryHistory,
     QueryResponse,
+    QuerySummary,
     QueryUpdate,
 )
 from app.services.query_executor import QueryExecutor
 
 router = APIRouter(prefix="/queries", tags=["Queries"])
 
+# Short TTL — history pages only need to survive UI polling bursts
+QUERY_HISTORY_CACHE_TTL = 30
+
+# Validates whole result lists in one pydantic-core call instead of a
+# per-row model_validate comprehension
+_QUERY_LIST_ADAPTER = TypeAdapter(List[QuerySummary])
+
+
+async def _history_version(user_id: UUID) -> Optional[int]:
+    """
+    Get the current history-cache version for a user.
+
+    Each write to a user's query history bumps the version, which is baked
+    into the page cache keys — an O(1) invalidation that never scans keys.
+    Returns None if Redis is unreachable, in which case caching is skipped.
+    """
+    try:
+        raw = await get_redis().get(f"qhist_ver:{user_id}")
+    except Exception:
+        return None
+    return int(raw) if raw is not None else 0
+
+
+async def _bump_history_version(user_id: UUID) -> None:
+    """Invalidate all cached history pages for a user."""
+    try:
+        await get_redis().incr(f"qhist_ver:{user_id}")
+    except Exception:
+        pass
+
 
 @router.post(
     "",
@@ -31,7 +65,7 @@ async def create_and_execute_query(
     query_in: QueryCreate,
     db: DbSession,
     current_user: CurrentUser,
-) -> QueryExecuteResult:
+) -> ORJSONResponse:
     """
     Process a natural language query:
     1. Generate SQL from natural language using Claude
@@ -59,7 +93,11 @@ async def create_and_execute_query(
             detail=str(e),
         )
 
-    return QueryExecuteResult(**result)
+    await _bump_history_version(current_user.id)
+
+    # orjson serializes the slotted dataclass directly — no Pydantic
+    # validation pass over a result our own pipeline just produced
+    return ORJSONResponse(content=result, status_code=status.HTTP_201_CREATED)
 
 
 @router.post(
@@ -71,7 +109,7 @@ async def execute_query(
     query_in: QueryExecute,
     db: DbSession,
     current_user: CurrentUser,
-) -> QueryExecuteResult:
+) -> ORJSONResponse:
     """
     Execute a natural language query without saving to history.
 
@@ -92,7 +130,39 @@ async def execute_query(
             detail=str(e),
         )
 
-    return QueryExecuteResult(**result)
+    return ORJSONResponse(content=result)
+
+
+@router.post(
+    "/execute/stream",
+    summary="Execute query and stream results",
+)
+async def execute_query_stream(
+    query_in: QueryExecute,
+    db: DbSession,
+    current_user: CurrentUser,
+) -> StreamingResponse:
+    """
+    Execute a natural language query and stream the result rows.
+
+    Rows are encoded incrementally instead of being materialized in
+    memory, so arbitrarily large result sets can be returned. Streamed
+    queries are not saved to history.
+    """
+    executor = QueryExecutor(db)
+
+    try:
+        stream = await executor.execute_nl_query_stream(
+            natural_language_query=query_in.natural_language_query,
+            data_source_id=query_in.data_source_id,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    return StreamingResponse(stream, media_type="application/json")
 
 
 @router.get(
@@ -109,6 +179,18 @@ async def get_query_history(
     """
     Get paginated query history for the current user.
     """
+    version = await _history_version(current_user.id)
+    cache_key = (
+        f"qhist:{current_user.id}:{version}:{page}:{per_page}"
+        if version is not None
+        else None
+    )
+
+    if cache_key is not None:
+        cached = await cache_get_json(cache_key)
+        if cached is not None:
+            return QueryHistory.model_validate(cached)
+
     executor = QueryExecutor(db)
     queries, total = await executor.get_query_history(
         user_id=current_user.id,
@@ -116,26 +198,36 @@ async def get_query_history(
         per_page=per_page,
     )
 
-    return QueryHistory(
-        queries=[QueryResponse.model_validate(q) for q in queries],
+    history = QueryHistory(
+        queries=_QUERY_LIST_ADAPTER.validate_python(queries, from_attributes=True),
         total=total,
         page=page,
         per_page=per_page,
     )
 
+    if cache_key is not None:
+        await cache_set_json(
+            cache_key, history.model_dump(mode="json"), ttl=QUERY_HISTORY_CACHE_TTL
+        )
+
+    return history
+
 
 @router.get(
     "/{query_id}",
-    response_model=QueryResponse,
     summary="Get specific query",
 )
 async def get_query(
     query_id: UUID,
     db: DbSession,
     current_user: CurrentUser,
-) -> QueryResponse:
+) -> ORJSONResponse:
     """
     Get a specific query by ID.
+
+    Serialized directly through QueryResponse's cached pydantic-core
+    serializer, skipping FastAPI's response_model re-validation pass on
+    this hot endpoint.
     """
     executor = QueryExecutor(db)
     query = await executor.get_query_by_id(query_id, current_user.id)
@@ -146,12 +238,14 @@ async def get_query(
             detail="Query not found",
         )
 
-    return QueryResponse.model_validate(query)
+    return ORJSONResponse(
+        content=QueryResponse.from_orm_trusted(query).model_dump(mode="json")
+    )
 
 
 @router.patch(
     "/{query_id}",
-    response_model=QueryResponse,
+    response_model=QuerySummary,
     summary="Update query",
 )
 async def update_query(
@@ -159,12 +253,19 @@ async def update_query(
     query_update: QueryUpdate,
     db: DbSession,
     current_user: CurrentUser,
-) -> QueryResponse:
+) -> QuerySummary:
     """
     Update query metadata (name, favorite status).
     """
     executor = QueryExecutor(db)
-    query = await executor.get_query_by_id(query_id, current_user.id)
+
+    # Single UPDATE ... RETURNING round-trip — no preliminary fetch
+    query = await executor.update_query(
+        query_id,
+        current_user.id,
+        name=query_update.name,
+        is_favorite=query_update.is_favorite,
+    )
 
     if not query:
         raise HTTPException(
@@ -172,13 +273,9 @@ async def update_query(
             detail="Query not found",
         )
 
-    query = await executor.update_query(
-        query,
-        name=query_update.name,
-        is_favorite=query_update.is_favorite,
-    )
+    await _bump_history_version(current_user.id)
 
-    return QueryResponse.model_validate(query)
+    return QuerySummary.from_orm_trusted(query)
 
 
 @router.delete(
@@ -195,12 +292,14 @@ async def delete_query(
     Delete a query from history.
     """
     executor = QueryExecutor(db)
-    query = await executor.get_query_by_id(query_id, current_user.id)
 
-    if not query:
+    # Single DELETE round-trip — no preliminary fetch
+    deleted = await executor.delete_query(query_id, current_user.id)
+
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Query not found",
         )
 
-    await executor.delete_query(query)
+    await _bump_history_version(current_user.id)
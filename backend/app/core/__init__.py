@@ -2,6 +2,7 @@
 Core module exports.
 """
 
+from app.core.cache import close_redis, get_redis
 from app.core.config import settings
 
-__all__ = ["settings"]
+__all__ = ["settings", "get_redis", "close_redis"]
@@ -0,0 +1,84 @@
+"""
+Redis cache utilities.
+
+Provides a lazily-initialized async Redis client shared across the
+application, plus small JSON get/set/delete helpers that degrade
+gracefully when Redis is unavailable. Mirrors the lazy engine
+initialization in app.db.session so that importing this module never
+opens a network connection.
+"""
+
+import json
+from typing import Any, Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+# Global Redis client (lazily initialized)
+_redis: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """
+    Get or create the shared async Redis client.
+
+    Uses lazy initialization to avoid import-time network connections,
+    which is important for testing and configuration.
+
+    Returns:
+        Redis: The shared redis.asyncio client.
+    """
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis
+
+
+async def cache_get_json(key: str) -> Optional[Any]:
+    """
+    Get a JSON value from the cache.
+
+    Returns None on a miss or if Redis is unreachable, so callers can
+    always fall back to the authoritative store.
+    """
+    try:
+        raw = await get_redis().get(key)
+    except Exception:
+        return None
+    if raw is None:
+        return None
+    try:
+        return json.loads(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+async def cache_set_json(key: str, value: Any, ttl: int) -> None:
+    """Set a JSON value in the cache with a TTL, ignoring Redis errors."""
+    try:
+        await get_redis().set(key, json.dumps(value), ex=ttl)
+    except Exception:
+        pass
+
+
+async def cache_delete(*keys: str) -> None:
+    """Delete keys from the cache, ignoring Redis errors."""
+    if not keys:
+        return
+    try:
+        await get_redis().delete(*keys)
+    except Exception:
+        pass
+
+
+async def close_redis() -> None:
+    """
+    Close the shared Redis client.
+
+    Should be called during application shutdown.
+    """
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
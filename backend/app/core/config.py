@@ -4,7 +4,8 @@ Application configuration settings.
 Uses Pydantic Settings for environment variable parsing and validation.
 """
 
-from typing import List, Optional, Union
+import json
+from typing import FrozenSet, List, Optional, Union
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -35,37 +36,46 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = Field(..., description="PostgreSQL async connection string")
-    DB_POOL_SIZE: int = Field(default=5, ge=1, le=100)
-    DB_MAX_OVERFLOW: int = Field(default=10, ge=0, le=100)
+    DB_POOL_SIZE: int = Field(default=20, ge=1, le=100)
+    DB_MAX_OVERFLOW: int = Field(default=20, ge=0, le=100)
     DB_POOL_TIMEOUT: int = Field(default=30, ge=1)
+    DB_POOL_RECYCLE: int = Field(default=1800, ge=1)
+    DB_STATEMENT_CACHE_SIZE: int = Field(default=256, ge=0)
+    DB_BEHIND_PGBOUNCER: bool = Field(
+        default=False,
+        description="Force PgBouncer transaction-pooling mode regardless of port",
+    )
 
     # Redis
     REDIS_URL: str = Field(default="redis://localhost:6379")
+    SCHEMA_CACHE_TTL_SEC: int = Field(default=600, ge=1)
 
     # Security
     SECRET_KEY: str = Field(..., min_length=8)
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, ge=1)
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7, ge=1)
+    BCRYPT_ROUNDS: int = Field(default=12, ge=4, le=31)
 
-    # CORS
-    BACKEND_CORS_ORIGINS: List[str] = Field(
-        default=["http://localhost:3000", "http://localhost:8000"]
+    # CORS — parsed once at settings construction into an immutable set so
+    # the middleware's membership checks stay O(1) against a constant
+    BACKEND_CORS_ORIGINS: FrozenSet[str] = Field(
+        default=frozenset(["http://localhost:3000", "http://localhost:8000"])
     )
 
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
     @classmethod
-    def parse_cors_origins(cls, v: Union[str, List[str]]) -> List[str]:
-        """Parse CORS origins from string or list."""
+    def parse_cors_origins(cls, v: Union[str, List[str], FrozenSet[str]]) -> FrozenSet[str]:
+        """Parse CORS origins from string or list into a frozen set."""
         if isinstance(v, str):
             # Handle JSON-like string from environment
             if v.startswith("["):
-                import json
-
-                return json.loads(v)
+                return frozenset(json.loads(v))
             # Handle comma-separated string
-            return [origin.strip() for origin in v.split(",") if origin.strip()]
-        return v
+            return frozenset(
+                origin.strip() for origin in v.split(",") if origin.strip()
+            )
+        return frozenset(v)
 
     # Logging
     LOG_LEVEL: str = Field(default="INFO")
@@ -73,6 +83,10 @@ class Settings(BaseSettings):
     # Claude API (for NL→SQL)
     ANTHROPIC_API_KEY: str = Field(default="", description="Anthropic API key for Claude")
     CLAUDE_MODEL: str = Field(default="claude-sonnet-4-20250514", description="Claude model to use")
+    CLAUDE_NL2SQL_MODEL: str = Field(
+        default="claude-haiku-4-5",
+        description="Fast model for NL→SQL generation; CLAUDE_MODEL is the escalation tier",
+    )
 
 
 # Create global settings instance
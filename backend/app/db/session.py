@@ -7,7 +7,9 @@ Uses lazy initialization to avoid import-time database connections.
 
 from typing import AsyncGenerator, Optional
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
@@ -15,6 +17,9 @@ from app.core.config import settings
 _engine: Optional[AsyncEngine] = None
 _async_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
 
+# PgBouncer's conventional listen port; used to detect transaction pooling
+PGBOUNCER_PORT = 6432
+
 
 def get_engine() -> AsyncEngine:
     """
@@ -23,19 +28,43 @@ def get_engine() -> AsyncEngine:
     Uses lazy initialization to avoid import-time database connections,
     which is important for testing and configuration.
 
+    When DATABASE_URL points at PgBouncer (port 6432), SQLAlchemy-side
+    pooling and asyncpg's prepared statement caches are disabled — both
+    are required for transaction pooling mode, where PgBouncer multiplexes
+    server connections across clients.
+
     Returns:
         AsyncEngine: The SQLAlchemy async engine.
     """
     global _engine
     if _engine is None:
-        _engine = create_async_engine(
-            settings.DATABASE_URL,
-            echo=False,
-            pool_pre_ping=True,  # Health check before using connections
-            pool_size=settings.DB_POOL_SIZE,
-            max_overflow=settings.DB_MAX_OVERFLOW,
-            pool_timeout=settings.DB_POOL_TIMEOUT,
-        )
+        url = make_url(settings.DATABASE_URL)
+        if settings.DB_BEHIND_PGBOUNCER or url.port == PGBOUNCER_PORT:
+            _engine = create_async_engine(
+                settings.DATABASE_URL,
+                echo=False,
+                poolclass=NullPool,
+                connect_args={
+                    "statement_cache_size": 0,
+                    "prepared_statement_cache_size": 0,
+                },
+            )
+        else:
+            _engine = create_async_engine(
+                settings.DATABASE_URL,
+                echo=False,
+                pool_pre_ping=True,  # Health check before using connections
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_timeout=settings.DB_POOL_TIMEOUT,
+                pool_recycle=settings.DB_POOL_RECYCLE,
+                # Let repeat statements (e.g. the per-request user fetch)
+                # skip PARSE/BIND via asyncpg's prepared statement cache
+                connect_args={
+                    "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+                    "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+                },
+            )
     return _engine
 
 
@@ -8,7 +8,7 @@ from app.models.base import BaseModel, TimestampMixin
 from app.models.dashboard import Dashboard, DashboardWidget
 from app.models.data_source import DataSource, DataSourceType
 from app.models.organization import Organization, OrganizationRole, UserOrganization
-from app.models.query import Query
+from app.models.query import Query, QueryExecution
 from app.models.user import User
 
 __all__ = [
@@ -26,6 +26,7 @@ __all__ = [
     "DataSourceType",
     # Query
     "Query",
+    "QueryExecution",
     # Dashboard
     "Dashboard",
     "DashboardWidget",
@@ -6,15 +6,51 @@ Provides common fields (id, timestamps) and utilities for all models.
 
 import uuid
 from datetime import datetime
-from typing import Any
+from enum import Enum
+from operator import attrgetter
+from typing import Any, ClassVar, Dict, Optional, Tuple, Type
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, SmallInteger, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
+from uuid6 import uuid7
 
 from app.db.base import Base
 
 
+class SmallIntEnum(TypeDecorator):
+    """
+    Store a Python Enum as a 2-byte SMALLINT.
+
+    Postgres named enum types cost 4 bytes plus catalog lookups and force
+    string coercion per row on load; a SMALLINT code keeps rows and
+    indexes tight while the Python side still works with the enum. Codes
+    are explicit so reordering enum members never changes stored values.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls: Type[Enum], codes: Dict[Enum, int]):
+        super().__init__()
+        self._enum_cls = enum_cls
+        self._to_code = dict(codes)
+        self._from_code = {code: member for member, code in codes.items()}
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[int]:
+        if value is None:
+            return None
+        if not isinstance(value, self._enum_cls):
+            value = self._enum_cls(value)
+        return self._to_code[value]
+
+    def process_result_value(self, value: Any, dialect: Any) -> Optional[Enum]:
+        if value is None:
+            return None
+        return self._from_code[value]
+
+
 class TimestampMixin:
     """
     Mixin that adds created_at and updated_at timestamps to models.
@@ -41,17 +77,21 @@ class BaseModel(TimestampMixin, Base):
 
     All application models should inherit from this class.
     Provides:
-        - UUID primary key
+        - UUIDv7 primary key (time-ordered, so inserts append to the
+          rightmost B-tree pages instead of dirtying random leaves)
         - created_at timestamp (auto-set on insert)
         - updated_at timestamp (auto-updated on changes)
     """
 
     __abstract__ = True
 
+    # Per-class (column names, bulk attrgetter) pair built lazily by to_dict
+    _to_dict_accessors: ClassVar[Optional[Tuple[Tuple[str, ...], Any]]] = None
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         nullable=False,
     )
 
@@ -60,5 +100,19 @@ class BaseModel(TimestampMixin, Base):
         return f"<{self.__class__.__name__}(id={self.id})>"
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert model to dictionary."""
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        """
+        Convert model to dictionary.
+
+        Column names and a single bulk attrgetter are cached per class on
+        first use, so repeated calls (list endpoints serializing many rows)
+        skip SQLAlchemy table introspection and fetch every value in one
+        C-level call.
+        """
+        cls = type(self)
+        accessors = cls._to_dict_accessors
+        if accessors is None:
+            names = tuple(c.name for c in cls.__table__.columns)
+            accessors = (names, attrgetter(*names))
+            cls._to_dict_accessors = accessors
+        names, getter = accessors
+        return dict(zip(names, getter(self)))
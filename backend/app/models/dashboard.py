@@ -5,8 +5,8 @@ Dashboard model for storing user dashboards and widgets.
 import uuid
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -25,6 +25,17 @@ class Dashboard(BaseModel):
 
     __tablename__ = "dashboards"
 
+    # jsonb_path_ops GIN: supports @> containment and is far smaller than
+    # the default jsonb_ops index
+    __table_args__ = (
+        Index(
+            "ix_dashboards_layout_gin",
+            "layout",
+            postgresql_using="gin",
+            postgresql_ops={"layout": "jsonb_path_ops"},
+        ),
+    )
+
     name: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
@@ -34,9 +45,9 @@ class Dashboard(BaseModel):
         nullable=True,
     )
 
-    # Layout configuration (JSON)
+    # Layout configuration (JSONB — indexed for @> containment lookups)
     layout: Mapped[Optional[dict]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=True,
         default=dict,
     )
@@ -69,14 +80,17 @@ class Dashboard(BaseModel):
     owner: Mapped["User"] = relationship(
         "User",
         back_populates="dashboards",
+        lazy="raise",
     )
     organization: Mapped["Organization"] = relationship(
         "Organization",
         back_populates="dashboards",
+        lazy="raise",
     )
     widgets: Mapped[List["DashboardWidget"]] = relationship(
         "DashboardWidget",
         back_populates="dashboard",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
 
@@ -94,6 +108,15 @@ class DashboardWidget(BaseModel):
 
     __tablename__ = "dashboard_widgets"
 
+    __table_args__ = (
+        Index(
+            "ix_dashboard_widgets_config_gin",
+            "config",
+            postgresql_using="gin",
+            postgresql_ops={"config": "jsonb_path_ops"},
+        ),
+    )
+
     name: Mapped[Optional[str]] = mapped_column(
         String(255),
         nullable=True,
@@ -103,9 +126,9 @@ class DashboardWidget(BaseModel):
         nullable=False,
     )
 
-    # Widget configuration (JSON)
+    # Widget configuration (JSONB — indexed for @> containment lookups)
     config: Mapped[Optional[dict]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=True,
         default=dict,
     )
@@ -150,6 +173,7 @@ class DashboardWidget(BaseModel):
     dashboard: Mapped["Dashboard"] = relationship(
         "Dashboard",
         back_populates="widgets",
+        lazy="raise",
     )
 
     def __repr__(self) -> str:
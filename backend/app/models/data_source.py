@@ -6,11 +6,11 @@ import uuid
 from enum import Enum
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Boolean, Enum as SQLEnum, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, ForeignKey, Integer, LargeBinary, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, SmallIntEnum
 
 if TYPE_CHECKING:
     from app.models.organization import Organization
@@ -26,6 +26,15 @@ class DataSourceType(str, Enum):
     CSV = "csv"
 
 
+# Stable SMALLINT codes for stored types — never renumber
+DATA_SOURCE_TYPE_CODES = {
+    DataSourceType.POSTGRESQL: 1,
+    DataSourceType.MYSQL: 2,
+    DataSourceType.SQLITE: 3,
+    DataSourceType.CSV: 4,
+}
+
+
 class DataSource(BaseModel):
     """
     DataSource model for external database connections.
@@ -45,7 +54,7 @@ class DataSource(BaseModel):
         nullable=True,
     )
     type: Mapped[DataSourceType] = mapped_column(
-        SQLEnum(DataSourceType),
+        SmallIntEnum(DataSourceType, DATA_SOURCE_TYPE_CODES),
         nullable=False,
     )
 
@@ -66,9 +75,10 @@ class DataSource(BaseModel):
         String(255),
         nullable=True,
     )
-    # Encrypted password - actual encryption at service layer
-    encrypted_password: Mapped[Optional[str]] = mapped_column(
-        Text,
+    # Encrypted password - actual encryption at service layer. Raw BYTEA:
+    # no base64 inflation, no UTF-8 validation on read.
+    encrypted_password: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary,
         nullable=True,
     )
 
@@ -85,9 +95,9 @@ class DataSource(BaseModel):
         nullable=False,
     )
 
-    # Schema cache (JSON stored as text)
-    schema_cache: Mapped[Optional[str]] = mapped_column(
-        Text,
+    # Schema cache (JSONB — stored parsed, no json.loads round-trip on read)
+    schema_cache: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
         nullable=True,
     )
 
@@ -102,10 +112,12 @@ class DataSource(BaseModel):
     organization: Mapped["Organization"] = relationship(
         "Organization",
         back_populates="data_sources",
+        lazy="raise",
     )
     queries: Mapped[List["Query"]] = relationship(
         "Query",
         back_populates="data_source",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
 
@@ -6,11 +6,11 @@ import uuid
 from enum import Enum
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Boolean, Enum as SQLEnum, ForeignKey, String, Text
+from sqlalchemy import Boolean, ForeignKey, Index, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, SmallIntEnum
 
 if TYPE_CHECKING:
     from app.models.dashboard import Dashboard
@@ -27,6 +27,15 @@ class OrganizationRole(str, Enum):
     VIEWER = "viewer"
 
 
+# Stable SMALLINT codes for stored roles — never renumber
+ORGANIZATION_ROLE_CODES = {
+    OrganizationRole.OWNER: 1,
+    OrganizationRole.ADMIN: 2,
+    OrganizationRole.MEMBER: 3,
+    OrganizationRole.VIEWER: 4,
+}
+
+
 class Organization(BaseModel):
     """
     Organization model for multi-tenancy.
@@ -54,16 +63,19 @@ class Organization(BaseModel):
     members: Mapped[List["UserOrganization"]] = relationship(
         "UserOrganization",
         back_populates="organization",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
     data_sources: Mapped[List["DataSource"]] = relationship(
         "DataSource",
         back_populates="organization",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
     dashboards: Mapped[List["Dashboard"]] = relationship(
         "Dashboard",
         back_populates="organization",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
 
@@ -81,6 +93,19 @@ class UserOrganization(BaseModel):
 
     __tablename__ = "user_organizations"
 
+    # Membership checks run per authenticated request; the covering index
+    # answers "role of user X in org Y" with an index-only scan, and the
+    # unique constraint rules out duplicate memberships
+    __table_args__ = (
+        UniqueConstraint("user_id", "organization_id", name="uq_user_org"),
+        Index(
+            "ix_user_org_covering",
+            "user_id",
+            "organization_id",
+            postgresql_include=["role"],
+        ),
+    )
+
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
@@ -92,7 +117,7 @@ class UserOrganization(BaseModel):
         nullable=False,
     )
     role: Mapped[OrganizationRole] = mapped_column(
-        SQLEnum(OrganizationRole),
+        SmallIntEnum(OrganizationRole, ORGANIZATION_ROLE_CODES),
         default=OrganizationRole.MEMBER,
         nullable=False,
     )
@@ -101,10 +126,12 @@ class UserOrganization(BaseModel):
     user: Mapped["User"] = relationship(
         "User",
         back_populates="organizations",
+        lazy="raise",
     )
     organization: Mapped["Organization"] = relationship(
         "Organization",
         back_populates="members",
+        lazy="raise",
     )
 
     def __repr__(self) -> str:
@@ -5,7 +5,7 @@ Query model for storing user queries and results.
 import uuid
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Float, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -25,6 +25,18 @@ class Query(BaseModel):
 
     __tablename__ = "queries"
 
+    # History pagination is always "latest N for user"; the composite DESC
+    # index serves it without a sort. Favorites are a tiny subset, so the
+    # partial index stays small enough to live in cache.
+    __table_args__ = (
+        Index("ix_queries_user_created", "user_id", text("created_at DESC")),
+        Index(
+            "ix_queries_favorites",
+            "user_id",
+            postgresql_where=text("is_favorite"),
+        ),
+    )
+
     # Query content
     natural_language_query: Mapped[str] = mapped_column(
         Text,
@@ -35,20 +47,6 @@ class Query(BaseModel):
         nullable=True,
     )
 
-    # Execution metadata
-    execution_time_ms: Mapped[Optional[float]] = mapped_column(
-        Float,
-        nullable=True,
-    )
-    result_rows_count: Mapped[Optional[int]] = mapped_column(
-        Integer,
-        nullable=True,
-    )
-    error_message: Mapped[Optional[str]] = mapped_column(
-        Text,
-        nullable=True,
-    )
-
     # User preferences
     is_favorite: Mapped[bool] = mapped_column(
         Boolean,
@@ -75,12 +73,76 @@ class Query(BaseModel):
     user: Mapped["User"] = relationship(
         "User",
         back_populates="queries",
+        lazy="raise",
     )
     data_source: Mapped["DataSource"] = relationship(
         "DataSource",
         back_populates="queries",
+        lazy="raise",
     )
+    execution: Mapped[Optional["QueryExecution"]] = relationship(
+        "QueryExecution",
+        back_populates="query",
+        lazy="raise",
+        uselist=False,
+        cascade="all, delete-orphan",
+    )
+
+    # Telemetry lives in query_executions; these accessors keep the detail
+    # view's serialization working when the execution row is eager-loaded
+    @property
+    def execution_time_ms(self) -> Optional[float]:
+        return self.execution.execution_time_ms if self.execution else None
+
+    @property
+    def result_rows_count(self) -> Optional[int]:
+        return self.execution.result_rows_count if self.execution else None
+
+    @property
+    def error_message(self) -> Optional[str]:
+        return self.execution.error_message if self.execution else None
 
     def __repr__(self) -> str:
         """Return string representation."""
         return f"<Query(id={self.id}, user_id={self.user_id})>"
+
+
+class QueryExecution(BaseModel):
+    """
+    Cold execution telemetry for a query.
+
+    Split out of the hot queries table so history scans read narrow rows;
+    only the detail view joins this table.
+    """
+
+    __tablename__ = "query_executions"
+
+    query_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("queries.id", ondelete="CASCADE"),
+        unique=True,
+        nullable=False,
+    )
+
+    execution_time_ms: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+    )
+    result_rows_count: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+    error_message: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+    )
+
+    query: Mapped["Query"] = relationship(
+        "Query",
+        back_populates="execution",
+        lazy="raise",
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"<QueryExecution(id={self.id}, query_id={self.query_id})>"
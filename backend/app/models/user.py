@@ -5,7 +5,7 @@ User model for authentication and authorization.
 import uuid
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Boolean, String, Text
+from sqlalchemy import Boolean, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -26,6 +26,17 @@ class User(BaseModel):
 
     __tablename__ = "users"
 
+    # Login only ever looks up active users; the partial index stays small
+    # and cache-hot. The full unique index on email remains the business
+    # rule (emails are globally unique, active or not).
+    __table_args__ = (
+        Index(
+            "ix_users_email_active",
+            "email",
+            postgresql_where=text("is_active"),
+        ),
+    )
+
     # Authentication
     email: Mapped[str] = mapped_column(
         String(255),
@@ -60,16 +71,19 @@ class User(BaseModel):
     organizations: Mapped[List["UserOrganization"]] = relationship(
         "UserOrganization",
         back_populates="user",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
     queries: Mapped[List["Query"]] = relationship(
         "Query",
         back_populates="user",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
     dashboards: Mapped[List["Dashboard"]] = relationship(
         "Dashboard",
         back_populates="owner",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
 
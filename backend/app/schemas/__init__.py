@@ -40,6 +40,7 @@ from app.schemas.query import (
     QueryExecuteResult,
     QueryHistory,
     QueryResponse,
+    QuerySummary,
     QueryUpdate,
 )
 from app.schemas.user import (
@@ -79,6 +80,7 @@ __all__ = [
     "QueryExecute",
     "QueryUpdate",
     "QueryResponse",
+    "QuerySummary",
     "QueryExecuteResult",
     "QueryHistory",
     # Dashboard
@@ -0,0 +1,59 @@
+"""
+Shared schema helpers.
+"""
+
+from typing import Any
+
+from pydantic.config import ConfigDict
+from pydantic.main import BaseModel
+
+
+class APISchema(BaseModel):
+    """
+    Common base for API schemas.
+
+    ``defer_build=True`` skips pydantic-core SchemaValidator
+    construction at class-definition time; each model builds its
+    validator on first use instead. Importing ``app.schemas`` then costs
+    class creation only, which keeps worker startup and test collection
+    fast — models nothing touches never build at all.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+def build_deferred_validators() -> None:
+    """
+    Force-build every APISchema validator and serializer.
+
+    Deferred builds keep imports cheap for tooling that never validates
+    (alembic, scripts, test collection), but a production worker should
+    not charge the first request for them — the lifespan startup calls
+    this once so every validator is compiled before serving. The test
+    session fixture reuses it for steady-state timings.
+    """
+    import app.schemas  # noqa: F401 — registers every schema subclass
+
+    stack = list(APISchema.__subclasses__())
+    while stack:
+        cls = stack.pop()
+        stack.extend(cls.__subclasses__())
+        cls.model_rebuild(force=True)
+
+
+class FromORMTrusted:
+    """
+    Mixin adding validation-free construction from trusted ORM rows.
+
+    ``model_validate(..., from_attributes=True)`` runs the full
+    pydantic-core validator per object. Rows we just read from (or wrote
+    to) our own database are already shaped by the column types, so
+    response construction can use ``model_construct`` and skip that pass.
+    Never use this for client-supplied input.
+    """
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any):
+        return cls.model_construct(
+            **{name: getattr(obj, name) for name in cls.model_fields}
+        )
@@ -6,10 +6,15 @@ import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+# Direct submodule imports skip pydantic.__init__'s lazy __getattr__
+# machinery on cold start
+from pydantic.config import ConfigDict
+from pydantic.fields import Field
 
+from app.schemas.base import APISchema
 
-class DashboardWidgetBase(BaseModel):
+
+class DashboardWidgetBase(APISchema):
     """Base schema for DashboardWidget."""
 
     name: Optional[str] = Field(None, max_length=255, description="Widget name")
@@ -30,7 +35,7 @@ class DashboardWidgetCreate(DashboardWidgetBase):
     query_id: Optional[uuid.UUID] = Field(None, description="Associated query ID")
 
 
-class DashboardWidgetUpdate(BaseModel):
+class DashboardWidgetUpdate(APISchema):
     """Schema for updating widget fields."""
 
     name: Optional[str] = Field(None, max_length=255, description="Updated name")
@@ -46,7 +51,7 @@ class DashboardWidgetUpdate(BaseModel):
 class DashboardWidgetResponse(DashboardWidgetBase):
     """Schema for widget response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
     id: uuid.UUID = Field(..., description="Widget ID")
     query_id: Optional[uuid.UUID] = Field(None, description="Associated query ID")
@@ -55,7 +60,7 @@ class DashboardWidgetResponse(DashboardWidgetBase):
     updated_at: datetime = Field(..., description="Last update timestamp")
 
 
-class DashboardBase(BaseModel):
+class DashboardBase(APISchema):
     """Base schema for Dashboard."""
 
     name: str = Field(..., min_length=1, max_length=255, description="Dashboard name")
@@ -77,7 +82,7 @@ class DashboardCreate(DashboardBase):
     )
 
 
-class DashboardUpdate(BaseModel):
+class DashboardUpdate(APISchema):
     """Schema for updating dashboard fields."""
 
     name: Optional[str] = Field(None, min_length=1, max_length=255, description="Updated name")
@@ -90,7 +95,7 @@ class DashboardUpdate(BaseModel):
 class DashboardResponse(DashboardBase):
     """Schema for dashboard response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
     id: uuid.UUID = Field(..., description="Dashboard ID")
     layout: Optional[Dict[str, Any]] = Field(None, description="Layout configuration")
@@ -6,12 +6,15 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic.config import ConfigDict
+from pydantic.fields import Field
+from pydantic.functional_validators import field_validator
 
 from app.models.data_source import DataSourceType
+from app.schemas.base import APISchema, FromORMTrusted
 
 
-class DataSourceBase(BaseModel):
+class DataSourceBase(APISchema):
     """Base schema for DataSource."""
 
     name: str = Field(..., min_length=1, max_length=255, description="Data source name")
@@ -43,7 +46,7 @@ class DataSourceCreate(DataSourceBase):
         return v
 
 
-class DataSourceUpdate(BaseModel):
+class DataSourceUpdate(APISchema):
     """Schema for updating data source fields."""
 
     name: Optional[str] = Field(None, min_length=1, max_length=255, description="Updated name")
@@ -56,10 +59,10 @@ class DataSourceUpdate(BaseModel):
     is_active: Optional[bool] = Field(None, description="Active status")
 
 
-class DataSourceResponse(DataSourceBase):
+class DataSourceResponse(DataSourceBase, FromORMTrusted):
     """Schema for data source response (excludes credentials)."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
     id: uuid.UUID = Field(..., description="Data source ID")
     host: Optional[str] = Field(None, description="Database host")
@@ -73,7 +76,7 @@ class DataSourceResponse(DataSourceBase):
     updated_at: datetime = Field(..., description="Last update timestamp")
 
 
-class DataSourceTestConnection(BaseModel):
+class DataSourceTestConnection(APISchema):
     """Schema for testing data source connection."""
 
     type: DataSourceType = Field(..., description="Database type")
@@ -85,9 +88,10 @@ class DataSourceTestConnection(BaseModel):
     file_path: Optional[str] = Field(None, description="File path for CSV/SQLite")
 
 
-class DataSourceTestResult(BaseModel):
+class DataSourceTestResult(APISchema):
     """Schema for connection test result."""
 
     success: bool = Field(..., description="Whether connection was successful")
     message: str = Field(..., description="Result message or error details")
     latency_ms: Optional[float] = Field(None, description="Connection latency in milliseconds")
+    cached: bool = Field(default=False, description="Whether this result was served from cache")
@@ -6,12 +6,14 @@ import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic.config import ConfigDict
+from pydantic.fields import Field
 
 from app.models.organization import OrganizationRole
+from app.schemas.base import APISchema
 
 
-class OrganizationBase(BaseModel):
+class OrganizationBase(APISchema):
     """Base schema for Organization."""
 
     name: str = Field(..., min_length=1, max_length=255, description="Organization name")
@@ -24,7 +26,7 @@ class OrganizationCreate(OrganizationBase):
     pass
 
 
-class OrganizationUpdate(BaseModel):
+class OrganizationUpdate(APISchema):
     """Schema for updating organization fields."""
 
     name: Optional[str] = Field(None, min_length=1, max_length=255, description="Updated name")
@@ -43,7 +45,7 @@ class OrganizationResponse(OrganizationBase):
     updated_at: datetime = Field(..., description="Last update timestamp")
 
 
-class UserOrganizationBase(BaseModel):
+class UserOrganizationBase(APISchema):
     """Base schema for user-organization membership."""
 
     role: OrganizationRole = Field(
@@ -6,10 +6,13 @@ import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic.config import ConfigDict
+from pydantic.fields import Field
 
+from app.schemas.base import APISchema, FromORMTrusted
 
-class QueryBase(BaseModel):
+
+class QueryBase(APISchema):
     """Base schema for Query."""
 
     natural_language_query: str = Field(
@@ -33,17 +36,37 @@ class QueryExecute(QueryBase):
     data_source_id: uuid.UUID = Field(..., description="Target data source ID")
 
 
-class QueryUpdate(BaseModel):
+class QueryUpdate(APISchema):
     """Schema for updating query fields."""
 
     name: Optional[str] = Field(None, max_length=255, description="Updated name")
     is_favorite: Optional[bool] = Field(None, description="Favorite status")
 
 
-class QueryResponse(QueryBase):
+class QuerySummary(QueryBase, FromORMTrusted):
+    """
+    Schema for query history entries.
+
+    Carries only the hot queries-table columns, so history listings never
+    join the cold query_executions telemetry table.
+    """
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
+    id: uuid.UUID = Field(..., description="Query ID")
+    generated_sql: Optional[str] = Field(None, description="Generated SQL query")
+    is_favorite: bool = Field(..., description="Favorite status")
+    name: Optional[str] = Field(None, description="Query name")
+    user_id: uuid.UUID = Field(..., description="Owner user ID")
+    data_source_id: uuid.UUID = Field(..., description="Data source ID")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+
+class QueryResponse(QueryBase, FromORMTrusted):
     """Schema for query response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
     id: uuid.UUID = Field(..., description="Query ID")
     generated_sql: Optional[str] = Field(None, description="Generated SQL query")
@@ -58,7 +81,7 @@ class QueryResponse(QueryBase):
     updated_at: datetime = Field(..., description="Last update timestamp")
 
 
-class QueryExecuteResult(BaseModel):
+class QueryExecuteResult(APISchema):
     """Schema for query execution result."""
 
     query_id: Optional[uuid.UUID] = Field(None, description="Query ID if saved")
@@ -71,10 +94,10 @@ class QueryExecuteResult(BaseModel):
     truncated: bool = Field(False, description="Whether results were truncated")
 
 
-class QueryHistory(BaseModel):
+class QueryHistory(APISchema):
     """Schema for query history list."""
 
-    queries: List[QueryResponse] = Field(..., description="List of queries")
+    queries: List[QuerySummary] = Field(..., description="List of queries")
     total: int = Field(..., description="Total count")
     page: int = Field(..., description="Current page")
     per_page: int = Field(..., description="Items per page")
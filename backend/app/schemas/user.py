@@ -6,10 +6,14 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic.config import ConfigDict
+from pydantic.fields import Field
+from pydantic.networks import EmailStr
 
+from app.schemas.base import APISchema, FromORMTrusted
 
-class UserBase(BaseModel):
+
+class UserBase(APISchema):
     """Base schema for User with common fields."""
 
     email: EmailStr = Field(..., description="User email address")
@@ -27,7 +31,7 @@ class UserCreate(UserBase):
     )
 
 
-class UserUpdate(BaseModel):
+class UserUpdate(APISchema):
     """Schema for updating user fields."""
 
     email: Optional[EmailStr] = Field(None, description="Updated email address")
@@ -41,10 +45,10 @@ class UserUpdate(BaseModel):
     is_active: Optional[bool] = Field(None, description="Account active status")
 
 
-class UserResponse(UserBase):
+class UserResponse(UserBase, FromORMTrusted):
     """Schema for user response (excludes sensitive data)."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
     id: uuid.UUID = Field(..., description="User ID")
     is_active: bool = Field(..., description="Account active status")
@@ -2,40 +2,85 @@
 Authentication service for JWT token management and password hashing.
 """
 
+import asyncio
+import hashlib
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+from jose import JWTError, jwk, jwt
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import get_redis
 from app.core.config import settings
 from app.models.user import User
 from app.schemas.user import UserCreate
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# How long a failed credential pair short-circuits to 401 without
+# touching bcrypt or Postgres. Kept short so a user who fixes a typo (or
+# just changed their password) isn't locked out noticeably.
+NEGATIVE_AUTH_TTL = 5
+
+# Pre-constructed HMAC key handle. Passing a raw secret makes jose rebuild
+# the key object (prepared-key derivation included) on every encode/decode;
+# a jwk.Key instance is used as-is.
+_SIGNING_KEY = jwk.construct(settings.SECRET_KEY, settings.ALGORITHM)
+
+
+def _negative_auth_key(email: str, password: str) -> str:
+    """Build the Redis key for a failed credential pair."""
+    digest = hashlib.blake2b(
+        f"{email}\x00{password}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return f"neg:{digest}"
+
+
+@lru_cache(maxsize=4096)
+def _decode_token_cached(token: str) -> Optional[dict]:
+    """
+    Decode and validate a JWT, memoized by the token string.
+
+    Tokens are content-addressed (the same string always decodes to the same
+    payload), so the HMAC verification and JSON parse only need to happen
+    once per token per process. Expiry must be re-checked by the caller on
+    cache hits since the cached entry outlives the token's `exp`.
+    """
+    try:
+        return jwt.decode(token, _SIGNING_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
 
 
 class AuthService:
-    """Service for authentication operations."""
+    """
+    Service for authentication operations.
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
+    Stateless by design: every method is a static method, and the ones that
+    touch the database take the session as their first argument. This keeps
+    call sites ergonomic while avoiding a per-request service allocation.
+    """
 
     # ==================== Password Operations ====================
 
     @staticmethod
     def hash_password(password: str) -> str:
         """Hash a plain text password."""
-        return pwd_context.hash(password)
+        salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+        return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash."""
-        return pwd_context.verify(plain_password, hashed_password)
+        try:
+            return bcrypt.checkpw(
+                plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+            )
+        except ValueError:
+            # Malformed or non-bcrypt hash
+            return False
 
     # ==================== Token Operations ====================
 
@@ -66,7 +111,7 @@ class AuthService:
             "exp": expire,
             "type": "access",
         }
-        return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+        return jwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.ALGORITHM)
 
     @staticmethod
     def create_refresh_token(
@@ -95,7 +140,45 @@ class AuthService:
             "exp": expire,
             "type": "refresh",
         }
-        return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+        return jwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.ALGORITHM)
+
+    @staticmethod
+    def create_token_pair(subject: str | UUID) -> tuple[str, str]:
+        """
+        Create an access/refresh token pair in one pass.
+
+        Both tokens share a single timestamp and subject string, and the
+        two HMAC signings run back-to-back — handlers can offload the whole
+        pair with one asyncio.to_thread call instead of two.
+
+        Args:
+            subject: The subject (user ID) to encode in both tokens
+
+        Returns:
+            Tuple of (access_token, refresh_token)
+        """
+        now = datetime.now(timezone.utc)
+        sub = str(subject)
+
+        access_token = jwt.encode(
+            {
+                "sub": sub,
+                "exp": now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+                "type": "access",
+            },
+            _SIGNING_KEY,
+            algorithm=settings.ALGORITHM,
+        )
+        refresh_token = jwt.encode(
+            {
+                "sub": sub,
+                "exp": now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+                "type": "refresh",
+            },
+            _SIGNING_KEY,
+            algorithm=settings.ALGORITHM,
+        )
+        return access_token, refresh_token
 
     @staticmethod
     def decode_token(token: str) -> Optional[dict]:
@@ -108,61 +191,100 @@ class AuthService:
         Returns:
             Decoded payload dict or None if invalid
         """
-        try:
-            payload = jwt.decode(
-                token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-            )
-            return payload
-        except JWTError:
+        payload = _decode_token_cached(token)
+        if payload is None:
             return None
 
+        # The memoized decode skips signature verification on hits, so the
+        # expiry claim has to be enforced here on every call.
+        exp = payload.get("exp")
+        if exp is not None and datetime.now(timezone.utc).timestamp() >= exp:
+            return None
+
+        return payload
+
     # ==================== User Operations ====================
 
-    async def get_user_by_email(self, email: str) -> Optional[User]:
+    @staticmethod
+    async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
         """Get a user by email address."""
-        result = await self.db.execute(select(User).where(User.email == email))
+        result = await db.execute(select(User).where(User.email == email))
         return result.scalar_one_or_none()
 
-    async def get_user_by_id(self, user_id: UUID) -> Optional[User]:
-        """Get a user by ID."""
-        result = await self.db.execute(select(User).where(User.id == user_id))
+    @staticmethod
+    async def get_user_by_id(db: AsyncSession, user_id: str | UUID) -> Optional[User]:
+        """Get a user by ID (accepts canonical string form or UUID)."""
+        result = await db.execute(select(User).where(User.id == user_id))
         return result.scalar_one_or_none()
 
-    async def create_user(self, user_in: UserCreate) -> User:
+    @staticmethod
+    async def create_user(db: AsyncSession, user_in: UserCreate) -> User:
         """
         Create a new user with hashed password.
 
         Args:
+            db: Database session
             user_in: User creation schema with plain password
 
         Returns:
             Created User model instance
         """
-        hashed_password = self.hash_password(user_in.password)
+        # Hashing is intentionally slow; run it off the event loop
+        hashed_password = await asyncio.to_thread(
+            AuthService.hash_password, user_in.password
+        )
         user = User(
             email=user_in.email,
             hashed_password=hashed_password,
             full_name=user_in.full_name,
         )
-        self.db.add(user)
-        await self.db.flush()
-        await self.db.refresh(user)
+        db.add(user)
+        # The INSERT's RETURNING clause already populates server-generated
+        # columns (id, timestamps) on flush — no refresh SELECT needed
+        await db.flush()
         return user
 
-    async def authenticate(self, email: str, password: str) -> Optional[User]:
+    @staticmethod
+    async def authenticate(
+        db: AsyncSession, email: str, password: str
+    ) -> Optional[User]:
         """
         Authenticate a user by email and password.
 
         Args:
+            db: Database session
             email: User email
             password: Plain text password
 
         Returns:
             User if credentials valid, None otherwise
         """
-        user = await self.get_user_by_email(email)
+        # Short-circuit credential pairs that just failed — absorbs
+        # credential-stuffing floods without exercising bcrypt or Postgres
+        neg_key = _negative_auth_key(email, password)
+        try:
+            if await get_redis().get(neg_key) is not None:
+                return None
+        except Exception:
+            pass
+
+        user = await AuthService.get_user_by_email(db, email)
         if not user:
+            await AuthService._remember_failed_login(neg_key)
             return None
-        if not self.verify_password(password, user.hashed_password):
+        # Verification is intentionally slow; run it off the event loop
+        verified = await asyncio.to_thread(
+            AuthService.verify_password, password, user.hashed_password
+        )
+        if not verified:
+            await AuthService._remember_failed_login(neg_key)
             return None
         return user
+
+    @staticmethod
+    async def _remember_failed_login(neg_key: str) -> None:
+        """Record a failed credential pair, ignoring Redis errors."""
+        try:
+            await get_redis().set(neg_key, "1", ex=NEGATIVE_AUTH_TTL)
+        except Exception:
+            pass
@@ -0,0 +1,53 @@
+"""
+Dashboard service for reading dashboards with their widgets.
+"""
+
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func, literal_column, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import TypeAdapter
+
+from app.models.dashboard import Dashboard, DashboardWidget
+from app.schemas.dashboard import DashboardWithWidgets
+
+# Validates the single aggregated row straight into the nested schema
+_DASHBOARD_ADAPTER = TypeAdapter(DashboardWithWidgets)
+
+
+class DashboardService:
+    """Service for dashboard retrieval."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_dashboard_with_widgets(
+        self, dashboard_id: UUID
+    ) -> Optional[DashboardWithWidgets]:
+        """
+        Get a dashboard and its widgets in a single round-trip.
+
+        Postgres aggregates the widget rows into a JSONB array with
+        jsonb_agg, so the nested shape arrives as one row instead of a
+        dashboard SELECT followed by a selectin for widgets.
+        """
+        widgets_json = func.coalesce(
+            func.jsonb_agg(func.to_jsonb(literal_column("dashboard_widgets"))).filter(
+                DashboardWidget.id.isnot(None)
+            ),
+            text("'[]'::jsonb"),
+        ).label("widgets")
+
+        result = await self.db.execute(
+            select(*Dashboard.__table__.columns, widgets_json)
+            .outerjoin(
+                DashboardWidget, DashboardWidget.dashboard_id == Dashboard.id
+            )
+            .where(Dashboard.id == dashboard_id)
+            .group_by(*Dashboard.__table__.columns)
+        )
+        row = result.mappings().first()
+        if row is None:
+            return None
+        return _DASHBOARD_ADAPTER.validate_python(dict(row))
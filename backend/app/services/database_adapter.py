@@ -6,19 +6,84 @@ and safe query execution.
 """
 
 import asyncio
-import json
+import re
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 
 import asyncpg
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.data_source import DataSource, DataSourceType
 
 
+# Introspection queries for get_schema — each covers every public table
+# in one pass, so schema fetch cost stays flat as the target DB grows
+ALL_COLUMNS_QUERY = """
+    SELECT
+        table_name,
+        column_name,
+        data_type,
+        is_nullable,
+        column_default,
+        character_maximum_length
+    FROM information_schema.columns
+    WHERE table_schema = 'public'
+    ORDER BY table_name, ordinal_position
+"""
+
+ALL_PRIMARY_KEYS_QUERY = """
+    SELECT c.relname AS table_name, a.attname AS column_name
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indrelid
+    JOIN pg_attribute a ON a.attrelid = i.indrelid
+        AND a.attnum = ANY(i.indkey)
+    WHERE i.indisprimary
+    AND c.relnamespace = 'public'::regnamespace
+"""
+
+ROW_ESTIMATES_QUERY = """
+    SELECT relname AS table_name, reltuples::bigint AS row_estimate
+    FROM pg_class
+    WHERE relkind = 'r'
+    AND relnamespace = 'public'::regnamespace
+"""
+
+
+# Single compiled scan over the query instead of seven substring passes
+# over an uppercased copy. Word boundaries also stop false positives on
+# identifiers like created_at or last_update.
+_FORBIDDEN_RE = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|DROP|TRUNCATE|ALTER|CREATE)\b", re.IGNORECASE
+)
+
+# Detects an explicit LIMIT so the row-cap wrapper is only added when the
+# generated SQL doesn't already bound its result set
+_LIMIT_RE = re.compile(r"\bLIMIT\s+\d+", re.IGNORECASE)
+
+
+def _ensure_read_only(query: str) -> None:
+    """
+    Validate that a query is a read-only SELECT/WITH statement.
+
+    Raises:
+        ValueError: If the query is not read-only
+    """
+    # Only the leading token needs case-folding — no full-string copy
+    head = query.lstrip()[:7].upper()
+    if not head.startswith("SELECT") and not head.startswith("WITH"):
+        raise ValueError("Only SELECT queries are allowed")
+
+    # Block dangerous operations
+    match = _FORBIDDEN_RE.search(query)
+    if match:
+        raise ValueError(
+            f"Query contains forbidden keyword: {match.group(1).upper()}"
+        )
+
+
 class DatabaseAdapter(ABC):
     """Abstract base class for database adapters."""
 
@@ -58,6 +123,43 @@ class DatabaseAdapter(ABC):
         """
         pass
 
+    @abstractmethod
+    def execute_query_stream(
+        self, query: str, timeout: float = 30.0, batch_size: int = 500
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Execute a read-only SQL query, yielding rows in batches.
+
+        Args:
+            query: SQL query string
+            timeout: Per-fetch timeout in seconds
+            batch_size: Number of rows per yielded batch
+
+        Yields:
+            Lists of row dicts
+        """
+        pass
+
+    @abstractmethod
+    def execute_query_json_stream(
+        self, query: str, timeout: float = 30.0, batch_size: int = 500
+    ) -> AsyncIterator[List[bytes]]:
+        """
+        Execute a read-only SQL query, yielding rows as JSON-encoded bytes.
+
+        The database encodes each row to JSON server-side, so no
+        per-column type decoding or dict construction happens in Python.
+
+        Args:
+            query: SQL query string
+            timeout: Per-fetch timeout in seconds
+            batch_size: Number of rows per yielded batch
+
+        Yields:
+            Lists of JSON object byte strings, one per row
+        """
+        pass
+
     @abstractmethod
     async def close(self) -> None:
         """Close the database connection."""
@@ -81,29 +183,42 @@ class PostgreSQLAdapter(DatabaseAdapter):
         self.username = username
         self.password = password
         self._pool: Optional[asyncpg.Pool] = None
+        self._pool_lock = asyncio.Lock()
 
     async def _get_pool(self) -> asyncpg.Pool:
         """Get or create connection pool."""
-        if self._pool is None:
-            self._pool = await asyncpg.create_pool(
-                host=self.host,
-                port=self.port,
-                database=self.database,
-                user=self.username,
-                password=self.password,
-                min_size=1,
-                max_size=5,
-                command_timeout=60,
-            )
+        if self._pool is not None:
+            return self._pool
+        # Double-checked locking: concurrent first requests would each
+        # create (and leak) their own pool without it
+        async with self._pool_lock:
+            if self._pool is None:
+                self._pool = await asyncpg.create_pool(
+                    host=self.host,
+                    port=self.port,
+                    database=self.database,
+                    user=self.username,
+                    password=self.password,
+                    min_size=2,
+                    max_size=10,
+                    # Per-connection establish timeout, so pool creation
+                    # can't hang on an unreachable host
+                    timeout=10,
+                    command_timeout=60,
+                    # Dashboards replay the same handful of queries; a larger
+                    # per-connection prepared-statement cache amortizes the
+                    # target DB's parse/plan cost across those repeats
+                    statement_cache_size=256,
+                )
         return self._pool
 
     async def test_connection(self) -> Tuple[bool, str, Optional[float]]:
         """Test PostgreSQL connection."""
         start_time = time.time()
         try:
-            pool = await asyncio.wait_for(self._get_pool(), timeout=10.0)
+            pool = await self._get_pool()
             async with pool.acquire() as conn:
-                await conn.fetchval("SELECT 1")
+                await conn.fetchval("SELECT 1", timeout=10.0)
             latency_ms = (time.time() - start_time) * 1000
             return True, "Connection successful", latency_ms
         except asyncio.TimeoutError:
@@ -122,82 +237,48 @@ class PostgreSQLAdapter(DatabaseAdapter):
         Get PostgreSQL schema information.
 
         Returns schema with tables, columns, types, and relationships.
+        Exactly three round-trips regardless of table count: one columns
+        scan, one primary-key scan, one catalog read for row estimates.
         """
         pool = await self._get_pool()
         async with pool.acquire() as conn:
-            # Get tables
-            tables_query = """
-                SELECT table_name
-                FROM information_schema.tables
-                WHERE table_schema = 'public'
-                AND table_type = 'BASE TABLE'
-                ORDER BY table_name
-            """
-            tables = await conn.fetch(tables_query)
-
-            schema = {"tables": {}}
-
-            for table_row in tables:
-                table_name = table_row["table_name"]
-
-                # Get columns for this table
-                columns_query = """
-                    SELECT 
-                        column_name,
-                        data_type,
-                        is_nullable,
-                        column_default,
-                        character_maximum_length
-                    FROM information_schema.columns
-                    WHERE table_schema = 'public'
-                    AND table_name = $1
-                    ORDER BY ordinal_position
-                """
-                columns = await conn.fetch(columns_query, table_name)
-
-                # Get primary keys
-                pk_query = """
-                    SELECT a.attname as column_name
-                    FROM pg_index i
-                    JOIN pg_attribute a ON a.attrelid = i.indrelid
-                        AND a.attnum = ANY(i.indkey)
-                    WHERE i.indrelid = $1::regclass
-                    AND i.indisprimary
-                """
-                try:
-                    pks = await conn.fetch(pk_query, table_name)
-                    primary_keys = [pk["column_name"] for pk in pks]
-                except Exception:
-                    primary_keys = []
-
-                schema["tables"][table_name] = {
-                    "columns": [
-                        {
-                            "name": col["column_name"],
-                            "type": col["data_type"],
-                            "nullable": col["is_nullable"] == "YES",
-                            "default": col["column_default"],
-                            "max_length": col["character_maximum_length"],
-                        }
-                        for col in columns
-                    ],
-                    "primary_keys": primary_keys,
+            columns = await conn.fetch(ALL_COLUMNS_QUERY)
+            pks = await conn.fetch(ALL_PRIMARY_KEYS_QUERY)
+            estimates = await conn.fetch(ROW_ESTIMATES_QUERY)
+
+        schema: Dict[str, Any] = {"tables": {}}
+
+        for col in columns:
+            table = schema["tables"].setdefault(
+                col["table_name"],
+                {"columns": [], "primary_keys": [], "row_count": None},
+            )
+            table["columns"].append(
+                {
+                    "name": col["column_name"],
+                    "type": col["data_type"],
+                    "nullable": col["is_nullable"] == "YES",
+                    "default": col["column_default"],
+                    "max_length": col["character_maximum_length"],
                 }
+            )
 
-            # Get row counts for each table
-            for table_name in schema["tables"]:
-                try:
-                    count = await conn.fetchval(
-                        f'SELECT COUNT(*) FROM "{table_name}"'
-                    )
-                    schema["tables"][table_name]["row_count"] = count
-                except Exception:
-                    schema["tables"][table_name]["row_count"] = None
+        for pk in pks:
+            table = schema["tables"].get(pk["table_name"])
+            if table is not None:
+                table["primary_keys"].append(pk["column_name"])
 
-            return schema
+        # reltuples is the planner's estimate — O(1) catalog read instead
+        # of a COUNT(*) seqscan per table
+        for est in estimates:
+            table = schema["tables"].get(est["table_name"])
+            if table is not None:
+                table["row_count"] = est["row_estimate"]
+
+        return schema
 
     async def execute_query(
-        self, query: str, timeout: float = 30.0
+        self, query: str, timeout: float = 30.0, row_cap: int = 10_000
     ) -> Tuple[List[Dict[str, Any]], List[str], float]:
         """
         Execute a read-only SQL query.
@@ -205,6 +286,9 @@ class PostgreSQLAdapter(DatabaseAdapter):
         Args:
             query: SQL query (must be SELECT)
             timeout: Query timeout in seconds
+            row_cap: Hard upper bound on fetched rows; queries without
+                their own LIMIT are wrapped so an unbounded SELECT can
+                never materialize an arbitrarily large result set here
 
         Returns:
             Tuple of (rows as dicts, column names, execution time ms)
@@ -214,40 +298,125 @@ class PostgreSQLAdapter(DatabaseAdapter):
             asyncpg.PostgresError: On database errors
         """
         # Validate query is read-only
-        normalized = query.strip().upper()
-        if not normalized.startswith("SELECT") and not normalized.startswith("WITH"):
-            raise ValueError("Only SELECT queries are allowed")
+        _ensure_read_only(query)
 
-        # Block dangerous operations
-        dangerous_keywords = ["INSERT", "UPDATE", "DELETE", "DROP", "TRUNCATE", "ALTER", "CREATE"]
-        for keyword in dangerous_keywords:
-            if keyword in normalized:
-                raise ValueError(f"Query contains forbidden keyword: {keyword}")
+        if _LIMIT_RE.search(query) is None:
+            query = (
+                f"SELECT * FROM ({query.rstrip().rstrip(';')}) _sub "
+                f"LIMIT {row_cap + 1}"
+            )
 
         pool = await self._get_pool()
         start_time = time.time()
 
         async with pool.acquire() as conn:
             try:
-                rows = await asyncio.wait_for(
-                    conn.fetch(query),
-                    timeout=timeout
-                )
+                # Preparing first exposes the column names once, so row
+                # conversion is dict(zip(...)) over positional values
+                # instead of per-row Record.keys() lookups. Timeouts are
+                # asyncpg-native — no extra Task/timer per call the way
+                # asyncio.wait_for would add.
+                stmt = await conn.prepare(query, timeout=timeout)
+                column_names = [attr.name for attr in stmt.get_attributes()]
+                rows = await stmt.fetch(timeout=timeout)
                 execution_time_ms = (time.time() - start_time) * 1000
 
-                # Convert to list of dicts
-                if rows:
-                    column_names = list(rows[0].keys())
-                    result = [dict(row) for row in rows]
-                else:
-                    column_names = []
-                    result = []
-
+                # The +1 sentinel row only signals overflow — drop it
+                result = [dict(zip(column_names, row)) for row in rows[:row_cap]]
                 return result, column_names, execution_time_ms
 
             except asyncio.TimeoutError:
                 raise ValueError(f"Query timeout after {timeout} seconds")
 
+    async def execute_query_stream(
+        self,
+        query: str,
+        timeout: float = 30.0,
+        batch_size: int = 500,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Execute a read-only SQL query and yield rows in batches.
+
+        Uses an asyncpg server-side cursor, so peak memory stays at
+        O(batch_size) regardless of the total result size.
+
+        Args:
+            query: SQL query (must be SELECT)
+            timeout: Per-fetch timeout in seconds
+            batch_size: Number of rows per yielded batch
+
+        Yields:
+            Lists of row dicts, batch_size rows at a time
+
+        Raises:
+            ValueError: If query is not a SELECT statement or times out
+            asyncpg.PostgresError: On database errors
+        """
+        _ensure_read_only(query)
+
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            # Cursors require an explicit transaction in asyncpg
+            async with conn.transaction():
+                stmt = await conn.prepare(query, timeout=timeout)
+                column_names = [attr.name for attr in stmt.get_attributes()]
+                cursor = await stmt.cursor(prefetch=batch_size)
+                while True:
+                    try:
+                        rows = await cursor.fetch(batch_size, timeout=timeout)
+                    except asyncio.TimeoutError:
+                        raise ValueError(f"Query timeout after {timeout} seconds")
+                    if not rows:
+                        break
+                    yield [dict(zip(column_names, row)) for row in rows]
+
+    async def execute_query_json_stream(
+        self,
+        query: str,
+        timeout: float = 30.0,
+        batch_size: int = 500,
+    ) -> AsyncIterator[List[bytes]]:
+        """
+        Execute a read-only SQL query, yielding JSON-encoded rows.
+
+        Wraps the query in row_to_json so Postgres does the encoding —
+        asyncpg never decodes individual columns and Python never builds
+        row dicts; each row arrives as a finished JSON object ready to
+        splice into the response body.
+
+        Args:
+            query: SQL query (must be SELECT)
+            timeout: Per-fetch timeout in seconds
+            batch_size: Number of rows per yielded batch
+
+        Yields:
+            Lists of JSON object byte strings, batch_size rows at a time
+
+        Raises:
+            ValueError: If query is not a SELECT statement or times out
+            asyncpg.PostgresError: On database errors
+        """
+        _ensure_read_only(query)
+
+        # Trailing semicolons would terminate the subquery early
+        wrapped = (
+            "SELECT row_to_json(_t.*)::text AS _row "
+            f"FROM ({query.rstrip().rstrip(';')}) _t"
+        )
+
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                cursor = await conn.cursor(wrapped, prefetch=batch_size)
+                while True:
+                    try:
+                        rows = await cursor.fetch(batch_size, timeout=timeout)
+                    except asyncio.TimeoutError:
+                        raise ValueError(f"Query timeout after {timeout} seconds")
+                    if not rows:
+                        break
+                    yield [row[0].encode("utf-8") for row in rows]
+
     async def close(self) -> None:
         """Close the connection pool."""
         if self._pool:
@@ -258,9 +427,44 @@ class PostgreSQLAdapter(DatabaseAdapter):
 class DataSourceService:
     """Service for managing data sources and their connections."""
 
+    # Process-level TTL memo of parsed schema dicts. Hot NL->SQL requests
+    # hit this before the row's JSONB cache or the remote database.
+    SCHEMA_MEMO_TTL = 300.0
+    _schema_memo: Dict[UUID, Tuple[float, Dict[str, Any]]] = {}
+
+    # Process-level adapter registry so repeat queries reuse warm asyncpg
+    # pools instead of paying a TCP+auth handshake per call. Bounded:
+    # oldest entry is closed and evicted when the cap is hit.
+    MAX_PERSISTENT_ADAPTERS = 32
+    _adapter_registry: Dict[UUID, DatabaseAdapter] = {}
+
     def __init__(self, db: AsyncSession):
         self.db = db
-        self._adapters: Dict[UUID, DatabaseAdapter] = {}
+
+    async def _get_persistent_adapter(self, data_source: DataSource) -> DatabaseAdapter:
+        """Get (or create and register) a long-lived adapter for a data source."""
+        adapter = self._adapter_registry.get(data_source.id)
+        if adapter is None:
+            adapter = self._create_adapter(data_source)
+            if len(self._adapter_registry) >= self.MAX_PERSISTENT_ADAPTERS:
+                oldest_id = next(iter(self._adapter_registry))
+                await self._adapter_registry.pop(oldest_id).close()
+            self._adapter_registry[data_source.id] = adapter
+        return adapter
+
+    async def _drop_persistent_adapter(self, data_source_id: UUID) -> None:
+        """Close and forget the registered adapter for a data source."""
+        adapter = self._adapter_registry.pop(data_source_id, None)
+        if adapter is not None:
+            await adapter.close()
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close every registered adapter pool. Wired into app shutdown."""
+        adapters = list(cls._adapter_registry.values())
+        cls._adapter_registry.clear()
+        for adapter in adapters:
+            await adapter.close()
 
     async def get_data_source(self, data_source_id: UUID) -> Optional[DataSource]:
         """Get a data source by ID."""
@@ -302,44 +506,65 @@ class DataSourceService:
             port=port,
             database=database,
             username=username,
-            encrypted_password=password,  # TODO: Encrypt in production
+            encrypted_password=password.encode("utf-8") if password else None,  # TODO: Encrypt in production
             file_path=file_path,
         )
         self.db.add(data_source)
+        # INSERT ... RETURNING populates server defaults on flush
         await self.db.flush()
-        await self.db.refresh(data_source)
         return data_source
 
     async def update_data_source(
         self,
-        data_source: DataSource,
+        data_source_id: UUID,
         **kwargs,
-    ) -> DataSource:
-        """Update a data source."""
+    ) -> Optional[DataSource]:
+        """
+        Update a data source in a single UPDATE ... RETURNING round-trip.
+
+        Returns the updated data source, or None if no row matched.
+        """
+        values = {}
         for field, value in kwargs.items():
             if value is not None:
                 if field == "password":
-                    setattr(data_source, "encrypted_password", value)  # TODO: Encrypt
+                    values["encrypted_password"] = value.encode("utf-8")  # TODO: Encrypt
                 else:
-                    setattr(data_source, field, value)
-        await self.db.flush()
-        await self.db.refresh(data_source)
-        return data_source
+                    values[field] = value
 
-    async def delete_data_source(self, data_source: DataSource) -> None:
-        """Delete a data source."""
-        await self.db.delete(data_source)
-        await self.db.flush()
+        if not values:
+            # Nothing to change — just fetch the current row
+            return await self.get_data_source(data_source_id)
+
+        self._schema_memo.pop(data_source_id, None)
+        await self._drop_persistent_adapter(data_source_id)
+        result = await self.db.execute(
+            update(DataSource)
+            .where(DataSource.id == data_source_id)
+            .values(**values)
+            .returning(DataSource)
+        )
+        return result.scalar_one_or_none()
+
+    async def delete_data_source(self, data_source_id: UUID) -> bool:
+        """Delete a data source by ID. Returns True if a row was deleted."""
+        self._schema_memo.pop(data_source_id, None)
+        await self._drop_persistent_adapter(data_source_id)
+        result = await self.db.execute(
+            delete(DataSource).where(DataSource.id == data_source_id)
+        )
+        return result.rowcount > 0
 
     def _create_adapter(self, data_source: DataSource, password: Optional[str] = None) -> DatabaseAdapter:
         """Create an adapter for the data source type."""
         if data_source.type == DataSourceType.POSTGRESQL:
+            stored = data_source.encrypted_password
             return PostgreSQLAdapter(
                 host=data_source.host or "localhost",
                 port=data_source.port or 5432,
                 database=data_source.database or "",
                 username=data_source.username or "",
-                password=password or data_source.encrypted_password or "",
+                password=password or (stored.decode("utf-8") if stored else ""),
             )
         else:
             raise ValueError(f"Unsupported data source type: {data_source.type}")
@@ -378,24 +603,47 @@ class DataSourceService:
         finally:
             await adapter.close()
 
-    async def get_schema(self, data_source: DataSource) -> Dict[str, Any]:
-        """Get schema for a data source."""
-        # Check cache first
-        if data_source.schema_cache:
-            try:
-                return json.loads(data_source.schema_cache)
-            except json.JSONDecodeError:
-                pass
+    def peek_schema(self, data_source_id: UUID) -> Optional[Dict[str, Any]]:
+        """
+        Return the memoized schema for a data source, or None.
 
-        adapter = self._create_adapter(data_source)
-        try:
-            schema = await adapter.get_schema()
-            # Cache the schema
-            data_source.schema_cache = json.dumps(schema)
-            await self.db.flush()
-            return schema
-        finally:
-            await adapter.close()
+        Synchronous and side-effect free — only the process-level TTL
+        memo is consulted, so callers can probe for a warm schema before
+        the data source row has even been fetched.
+        """
+        memo = self._schema_memo.get(data_source_id)
+        if memo is not None and time.monotonic() - memo[0] < self.SCHEMA_MEMO_TTL:
+            return memo[1]
+        return None
+
+    async def get_schema(
+        self, data_source: DataSource, refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get schema for a data source.
+
+        Cache hierarchy: process-level TTL memo, then the row's JSONB
+        cache, then live introspection against the remote database.
+        Pass refresh=True to bypass both caches and re-introspect.
+        """
+        now = time.monotonic()
+        if not refresh:
+            memo = self._schema_memo.get(data_source.id)
+            if memo is not None and now - memo[0] < self.SCHEMA_MEMO_TTL:
+                return memo[1]
+
+            # JSONB comes back already parsed
+            if data_source.schema_cache:
+                self._schema_memo[data_source.id] = (now, data_source.schema_cache)
+                return data_source.schema_cache
+
+        adapter = await self._get_persistent_adapter(data_source)
+        schema = await adapter.get_schema()
+        # Cache the schema
+        data_source.schema_cache = schema
+        await self.db.flush()
+        self._schema_memo[data_source.id] = (now, schema)
+        return schema
 
     async def execute_query(
         self,
@@ -403,9 +651,28 @@ class DataSourceService:
         query: str,
         timeout: float = 30.0,
     ) -> Tuple[List[Dict[str, Any]], List[str], float]:
-        """Execute a query on a data source."""
-        adapter = self._create_adapter(data_source)
-        try:
-            return await adapter.execute_query(query, timeout)
-        finally:
-            await adapter.close()
+        """Execute a query on a data source via its persistent pool."""
+        adapter = await self._get_persistent_adapter(data_source)
+        return await adapter.execute_query(query, timeout)
+
+    async def execute_query_stream(
+        self,
+        data_source: DataSource,
+        query: str,
+        timeout: float = 30.0,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Execute a query on a data source, yielding rows in batches."""
+        adapter = await self._get_persistent_adapter(data_source)
+        async for batch in adapter.execute_query_stream(query, timeout):
+            yield batch
+
+    async def execute_query_json_stream(
+        self,
+        data_source: DataSource,
+        query: str,
+        timeout: float = 30.0,
+    ) -> AsyncIterator[List[bytes]]:
+        """Execute a query, yielding database-encoded JSON row batches."""
+        adapter = await self._get_persistent_adapter(data_source)
+        async for batch in adapter.execute_query_json_stream(query, timeout):
+            yield batch
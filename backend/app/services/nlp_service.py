@@ -4,29 +4,204 @@ NLP service for natural language to SQL conversion using Claude API.
 Provides schema-aware prompting and SQL validation.
 """
 
+import asyncio
+import hashlib
 import json
 import re
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 import httpx
+import sqlglot
+from sqlglot import exp
 
 from app.core.config import settings
 
 
+# Compiled once at import — _validate_sql runs on every NL→SQL request
+_MD_FENCE_OPEN = re.compile(r"^```(?:sql)?\s*")
+_MD_FENCE_CLOSE = re.compile(r"\s*```$")
+
+# AST node types that make a statement non-read-only. find() walks the
+# whole tree, so a data-modifying CTE (WITH x AS (INSERT ...) SELECT ...)
+# is caught even though the statement parses as a SELECT. Command covers
+# statement types sqlglot tokenizes but does not model (EXECUTE etc.).
+_FORBIDDEN_NODES = (
+    exp.Insert,
+    exp.Update,
+    exp.Delete,
+    exp.Drop,
+    exp.Create,
+    exp.Alter,
+    exp.TruncateTable,
+    exp.Grant,
+    exp.Command,
+)
+
+
+# Maximum rows to hint in prompt to avoid huge queries
+MAX_RESULT_ROWS = 1000
+
+# Short type codes for the compact schema notation — one or two chars
+# instead of spelled-out PostgreSQL type names
+_TOON_TYPE_MAP = {
+    "smallint": "i",
+    "integer": "i",
+    "bigint": "i",
+    "numeric": "r",
+    "real": "r",
+    "double precision": "r",
+    "money": "r",
+    "text": "s",
+    "character varying": "s",
+    "character": "s",
+    "uuid": "u",
+    "boolean": "b",
+    "date": "d",
+    "timestamp with time zone": "dt",
+    "timestamp without time zone": "dt",
+    "json": "j",
+    "jsonb": "j",
+}
+
+# Static rules/examples block — identical for every request, so it is the
+# first cacheable prefix segment of the system prompt
+_RULES_BLOCK = f"""You are a SQL expert that converts natural language questions into PostgreSQL queries.
+
+SCHEMA FORMAT: each line is table(~rows)[column:type,...] with type codes i=integer, r=numeric, s=text, b=boolean, d=date, dt=timestamp, u=uuid, j=json; a trailing ! means NOT NULL and * means primary key.
+
+RULES:
+1. Generate ONLY a valid PostgreSQL SELECT query. Never generate INSERT, UPDATE, DELETE, DROP, or any data-modifying statements.
+2. Use only tables and columns that exist in the schema provided.
+3. Always use double quotes around identifiers that might be reserved words or mixed case.
+4. Add LIMIT {MAX_RESULT_ROWS} to prevent overly large result sets, unless the user explicitly asks for all results.
+5. For aggregation queries, include meaningful column aliases using AS.
+6. Use appropriate JOINs when the query spans multiple tables.
+7. If the query is ambiguous, make reasonable assumptions and proceed.
+8. Return ONLY the SQL query, no explanations, no markdown formatting, no code blocks."""
+
+# Few-shot examples keyed by the tables they reference. An example whose
+# tables are absent from the target schema is worse than none — it burns
+# tokens and invites hallucinated joins — so each is emitted only when
+# every referenced table exists. They live in the schema block, not the
+# rules block, since their selection depends on the schema.
+_EXAMPLES: Tuple[Tuple[FrozenSet[str], str], ...] = (
+    (
+        frozenset({"orders"}),
+        '- "show me total sales by month" → SELECT DATE_TRUNC(\'month\', created_at) AS month, SUM(amount) AS total_sales FROM orders GROUP BY month ORDER BY month LIMIT '
+        f"{MAX_RESULT_ROWS}",
+    ),
+    (
+        frozenset({"users"}),
+        '- "how many users signed up last week" → SELECT COUNT(*) AS user_count FROM users WHERE created_at >= NOW() - INTERVAL \'7 days\'',
+    ),
+    (
+        frozenset({"order_items", "products"}),
+        '- "top 10 products by revenue" → SELECT product_name, SUM(price * quantity) AS revenue FROM order_items JOIN products ON order_items.product_id = products.id GROUP BY product_name ORDER BY revenue DESC LIMIT 10',
+    ),
+)
+
+_GENERIC_EXAMPLE = (
+    '- "show the matching rows" → SELECT column FROM table WHERE condition '
+    f"LIMIT {MAX_RESULT_ROWS}"
+)
+
+
 class NLPService:
     """Service for converting natural language queries to SQL using Claude."""
 
-    # Maximum rows to hint in prompt to avoid huge queries
-    MAX_RESULT_ROWS = 1000
+    # Kept as a class attribute for callers/tests that reference it
+    MAX_RESULT_ROWS = MAX_RESULT_ROWS
+
+    # Process-level TTL cache of validated SQL keyed by (normalized NL
+    # query, schema hash). Dashboards replay the same questions against
+    # the same schema, and a hit skips the entire Claude round-trip.
+    SQL_CACHE_TTL = 3600.0
+    SQL_CACHE_MAX = 1024
+    _sql_cache: Dict[str, Tuple[float, str]] = {}
+
+    # Schema dicts are memoized per data source, so hashing can key on
+    # object identity; the strong reference keeps the id stable.
+    _schema_hash_memo: Dict[int, Tuple[Dict[str, Any], str]] = {}
+
+    # Formatted schema blocks (compact context plus applicable examples)
+    # keyed by schema hash — the walk over every table and column only
+    # happens when a schema changes
+    _schema_context_cache: Dict[str, str] = {}
+
+    # Shared HTTP client — keep-alive avoids a fresh TCP+TLS handshake
+    # per NL query, and HTTP/2 lets concurrent calls share one connection
+    _client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """Get or create the process-wide API client."""
+        if cls._client is None:
+            cls._client = httpx.AsyncClient(
+                timeout=30.0,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=64, max_keepalive_connections=32
+                ),
+            )
+        return cls._client
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close the shared API client. Wired into app shutdown."""
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
 
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or settings.ANTHROPIC_API_KEY
+        # Fast tier for single-statement SQL generation; the general
+        # model is the escalation path when the fast output fails
+        # validation
+        self.fast_model = settings.CLAUDE_NL2SQL_MODEL
         self.model = settings.CLAUDE_MODEL
         self.api_url = "https://api.anthropic.com/v1/messages"
 
+    def _schema_hash(self, schema: Dict[str, Any]) -> str:
+        """Stable digest of a schema dict, memoized by object identity."""
+        memo = self._schema_hash_memo.get(id(schema))
+        if memo is not None and memo[0] is schema:
+            return memo[1]
+        digest = hashlib.blake2b(
+            json.dumps(schema, sort_keys=True, default=str).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+        if len(self._schema_hash_memo) >= 128:
+            self._schema_hash_memo.clear()
+        self._schema_hash_memo[id(schema)] = (schema, digest)
+        return digest
+
+    @staticmethod
+    def _fmt_table(table_name: str, table_info: Dict[str, Any]) -> str:
+        """Format one table block for the schema context."""
+        row_count = table_info.get("row_count")
+        row_str = f"  (~{row_count} rows)" if row_count is not None else ""
+        lines = [f"\nTable: {table_name}{row_str}"]
+
+        pks = table_info.get("primary_keys", [])
+        if pks:
+            lines.append(f"  Primary Key: {', '.join(pks)}")
+
+        lines.extend(
+            f"  - {col['name']} ({col['type']}"
+            f"{'' if col.get('nullable', True) else ', NOT NULL'})"
+            for col in table_info.get("columns", [])
+        )
+        return "\n".join(lines)
+
     def _build_schema_context(self, schema: Dict[str, Any]) -> str:
         """
-        Build a concise schema description for the Claude prompt.
+        Build a verbose, human-readable schema description.
+
+        One f-string per column and two joins total — no incremental
+        string concatenation in the loop. The prompt itself uses the
+        compact notation from _build_schema_context_toon; this render is
+        kept for logs and debugging.
 
         Args:
             schema: Database schema dict from DatabaseAdapter.get_schema()
@@ -34,127 +209,253 @@ class NLPService:
         Returns:
             Formatted schema string
         """
-        lines = ["DATABASE SCHEMA:"]
-
-        tables = schema.get("tables", {})
-        for table_name, table_info in tables.items():
-            columns = table_info.get("columns", [])
-            row_count = table_info.get("row_count")
-
-            col_defs = []
-            for col in columns:
-                col_str = f"  - {col['name']} ({col['type']}"
-                if not col.get("nullable", True):
-                    col_str += ", NOT NULL"
-                col_str += ")"
-                col_defs.append(col_str)
-
-            pks = table_info.get("primary_keys", [])
-            pk_str = f"  Primary Key: {', '.join(pks)}" if pks else ""
-
-            row_str = f"  (~{row_count} rows)" if row_count is not None else ""
+        parts = ["DATABASE SCHEMA:"]
+        parts.extend(
+            self._fmt_table(name, info)
+            for name, info in schema.get("tables", {}).items()
+        )
+        return "\n".join(parts)
+
+    @staticmethod
+    def _fmt_table_toon(table_name: str, table_info: Dict[str, Any]) -> str:
+        """Format one table as a single compact line."""
+        pks = set(table_info.get("primary_keys", []))
+        row_count = table_info.get("row_count")
+        row_str = f"(~{row_count})" if row_count is not None else ""
+        cols = ",".join(
+            f"{col['name']}:{_TOON_TYPE_MAP.get(col['type'], col['type'])}"
+            f"{'' if col.get('nullable', True) else '!'}"
+            f"{'*' if col['name'] in pks else ''}"
+            for col in table_info.get("columns", [])
+        )
+        return f"{table_name}{row_str}[{cols}]"
+
+    def _build_schema_context_toon(self, schema: Dict[str, Any]) -> str:
+        """
+        Build the compact schema notation used in the system prompt.
 
-            lines.append(f"\nTable: {table_name}{row_str}")
-            if pk_str:
-                lines.append(pk_str)
-            lines.extend(col_defs)
+        One line per table with short type codes — a fraction of the
+        input tokens of the verbose render, which directly cuts
+        time-to-first-token and per-query cost on large schemas. The
+        legend lives in the static rules block.
 
-        return "\n".join(lines)
+        Args:
+            schema: Database schema dict from DatabaseAdapter.get_schema()
 
-    def _build_prompt(
-        self,
-        query: str,
-        schema: Dict[str, Any],
-    ) -> str:
+        Returns:
+            Compact schema string
+        """
+        parts = ["DATABASE SCHEMA:"]
+        parts.extend(
+            self._fmt_table_toon(name, info)
+            for name, info in schema.get("tables", {}).items()
+        )
+        return "\n".join(parts)
+
+    @staticmethod
+    def _build_examples(schema: Dict[str, Any]) -> str:
         """
-        Build the system prompt for Claude.
+        Pick the few-shot examples that apply to this schema.
+
+        Only examples whose referenced tables all exist are kept; if
+        none apply, a single generic example stands in so the output
+        format is still demonstrated.
 
         Args:
-            query: Natural language query from user
-            schema: Database schema
+            schema: Database schema dict
 
         Returns:
-            System prompt string
+            EXAMPLES block string
         """
-        schema_context = self._build_schema_context(schema)
+        table_names = set(schema.get("tables", {}).keys())
+        lines = [
+            example
+            for required, example in _EXAMPLES
+            if required <= table_names
+        ]
+        if not lines:
+            lines = [_GENERIC_EXAMPLE]
+        return "EXAMPLES:\n" + "\n".join(lines)
 
-        return f"""You are a SQL expert that converts natural language questions into PostgreSQL queries.
+    def _build_system_blocks(self, schema: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Build the system prompt as cacheable blocks.
 
-{schema_context}
+        The static rules block and the per-data-source schema block
+        (compact schema plus the examples that apply to it) are both
+        marked with cache_control, so Claude reuses its KV state for the
+        whole system prefix on repeat queries against the same data
+        source — only the user question is processed fresh.
 
-RULES:
-1. Generate ONLY a valid PostgreSQL SELECT query. Never generate INSERT, UPDATE, DELETE, DROP, or any data-modifying statements.
-2. Use only tables and columns that exist in the schema above.
-3. Always use double quotes around identifiers that might be reserved words or mixed case.
-4. Add LIMIT {self.MAX_RESULT_ROWS} to prevent overly large result sets, unless the user explicitly asks for all results.
-5. For aggregation queries, include meaningful column aliases using AS.
-6. Use appropriate JOINs when the query spans multiple tables.
-7. If the query is ambiguous, make reasonable assumptions and proceed.
-8. Return ONLY the SQL query, no explanations, no markdown formatting, no code blocks.
+        Args:
+            schema: Database schema dict
 
-EXAMPLES:
-- "show me total sales by month" → SELECT DATE_TRUNC('month', created_at) AS month, SUM(amount) AS total_sales FROM orders GROUP BY month ORDER BY month LIMIT {self.MAX_RESULT_ROWS}
-- "how many users signed up last week" → SELECT COUNT(*) AS user_count FROM users WHERE created_at >= NOW() - INTERVAL '7 days'
-- "top 10 products by revenue" → SELECT product_name, SUM(price * quantity) AS revenue FROM order_items JOIN products ON order_items.product_id = products.id GROUP BY product_name ORDER BY revenue DESC LIMIT 10"""
+        Returns:
+            List of system content blocks for the messages API
+        """
+        schema_hash = self._schema_hash(schema)
+        context = self._schema_context_cache.get(schema_hash)
+        if context is None:
+            context = (
+                self._build_schema_context_toon(schema)
+                + "\n\n"
+                + self._build_examples(schema)
+            )
+            if len(self._schema_context_cache) >= 128:
+                self._schema_context_cache.clear()
+            self._schema_context_cache[schema_hash] = context
+
+        return [
+            {
+                "type": "text",
+                "text": _RULES_BLOCK,
+                "cache_control": {"type": "ephemeral"},
+            },
+            {
+                "type": "text",
+                "text": context,
+                "cache_control": {"type": "ephemeral"},
+            },
+        ]
 
     def _validate_sql(self, sql: str) -> str:
         """
-        Validate and sanitize generated SQL.
+        Validate and sanitize generated SQL by parsing it.
+
+        A real parse instead of keyword heuristics: "INSERT INTO" inside
+        a string literal no longer false-positives, and forbidden
+        operations are detected structurally wherever they appear in the
+        tree. Parsing also lets the LIMIT rule be enforced here rather
+        than trusted to the model — a missing top-level LIMIT is
+        injected into the AST.
 
         Args:
             sql: Generated SQL string
 
         Returns:
-            Cleaned SQL string
+            Cleaned SQL string, with LIMIT {MAX_RESULT_ROWS} added if absent
 
         Raises:
-            ValueError: If SQL contains dangerous operations
+            ValueError: If SQL does not parse, is not a read-only query,
+                or contains a forbidden operation
         """
         # Clean up the SQL
         sql = sql.strip()
 
         # Remove markdown code blocks if present
-        sql = re.sub(r"^```(?:sql)?\s*", "", sql)
-        sql = re.sub(r"\s*```$", "", sql)
+        sql = _MD_FENCE_OPEN.sub("", sql)
+        sql = _MD_FENCE_CLOSE.sub("", sql)
         sql = sql.strip()
 
         # Remove trailing semicolons
         sql = sql.rstrip(";").strip()
 
-        # Validate it's a SELECT / WITH statement
-        normalized = sql.upper().strip()
-        if not normalized.startswith("SELECT") and not normalized.startswith("WITH"):
+        try:
+            tree = sqlglot.parse_one(sql, read="postgres")
+        except sqlglot.errors.ParseError as e:
+            raise ValueError(f"Generated query is not valid PostgreSQL: {e}")
+
+        if not isinstance(tree, exp.Query):
             raise ValueError(
                 "Generated query is not a SELECT statement. "
                 "Only read-only queries are supported."
             )
 
-        # Block dangerous keywords
-        dangerous = [
-            "INSERT INTO",
-            "UPDATE ",
-            "DELETE FROM",
-            "DROP ",
-            "TRUNCATE ",
-            "ALTER ",
-            "CREATE ",
-            "GRANT ",
-            "REVOKE ",
-            "EXEC ",
-            "EXECUTE ",
-        ]
-        for keyword in dangerous:
-            if keyword in normalized:
-                raise ValueError(
-                    f"Generated query contains forbidden operation: {keyword.strip()}"
-                )
+        forbidden = tree.find(*_FORBIDDEN_NODES)
+        if forbidden is not None:
+            raise ValueError(
+                f"Generated query contains forbidden operation: "
+                f"{forbidden.key.upper()}"
+            )
+
+        if tree.args.get("limit") is None:
+            return tree.limit(self.MAX_RESULT_ROWS).sql(dialect="postgres")
 
         return sql
 
+    async def _request_completion(
+        self,
+        model: str,
+        system_blocks: List[Dict[str, Any]],
+        natural_language_query: str,
+    ) -> str:
+        """
+        Request one SQL completion from the Claude API.
+
+        max_tokens stays tight — a single SELECT rarely approaches it —
+        and temperature 0 keeps output deterministic, which also makes
+        the SQL cache more effective.
+
+        Raises:
+            ValueError: On a non-200 API response
+        """
+        client = self._get_client()
+        response = await client.post(
+            self.api_url,
+            headers={
+                "x-api-key": self.api_key,
+                "anthropic-version": "2023-06-01",
+                "anthropic-beta": "prompt-caching-2024-07-31",
+                "content-type": "application/json",
+            },
+            json={
+                "model": model,
+                "max_tokens": 384,
+                "temperature": 0.0,
+                "system": system_blocks,
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": natural_language_query,
+                    }
+                ],
+            },
+        )
+
+        if response.status_code != 200:
+            error_detail = response.text
+            raise ValueError(
+                f"Claude API error (status {response.status_code}): {error_detail}"
+            )
+
+        data = response.json()
+        return data["content"][0]["text"]
+
+    def _cache_key(
+        self, natural_language_query: str, schema: Dict[str, Any]
+    ) -> str:
+        """SQL cache key for a (normalized NL query, schema) pair."""
+        return hashlib.blake2b(
+            (
+                natural_language_query.strip().lower()
+                + "|"
+                + self._schema_hash(schema)
+            ).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+
+    def check_cache(
+        self, natural_language_query: str, schema: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Return cached SQL for a query if present and fresh, else None.
+
+        Synchronous, so callers can probe for a hit before committing to
+        any awaits — QueryExecutor uses this to skip straight to
+        execution on the hot path.
+        """
+        cached = self._sql_cache.get(
+            self._cache_key(natural_language_query, schema)
+        )
+        if cached is not None and time.monotonic() - cached[0] < self.SQL_CACHE_TTL:
+            return cached[1]
+        return None
+
     async def generate_sql(
         self,
         natural_language_query: str,
         schema: Dict[str, Any],
+        bypass_cache: bool = False,
     ) -> str:
         """
         Convert a natural language query to SQL using Claude.
@@ -162,6 +463,7 @@ EXAMPLES:
         Args:
             natural_language_query: User's question in plain English
             schema: Database schema dictionary
+            bypass_cache: Skip the in-process SQL cache for this call
 
         Returns:
             Generated SQL query string
@@ -170,39 +472,69 @@ EXAMPLES:
             ValueError: If SQL validation fails
             httpx.HTTPError: If Claude API call fails
         """
-        system_prompt = self._build_prompt(natural_language_query, schema)
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                self.api_url,
-                headers={
-                    "x-api-key": self.api_key,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json",
-                },
-                json={
-                    "model": self.model,
-                    "max_tokens": 1024,
-                    "system": system_prompt,
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": natural_language_query,
-                        }
-                    ],
-                },
+        cache_key = self._cache_key(natural_language_query, schema)
+
+        if not bypass_cache:
+            cached = self._sql_cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < self.SQL_CACHE_TTL:
+                return cached[1]
+
+        system_blocks = self._build_system_blocks(schema)
+
+        generated_sql = await self._request_completion(
+            self.fast_model, system_blocks, natural_language_query
+        )
+
+        # Validate the SQL; escalate to the general model if the fast
+        # tier produced something malformed
+        try:
+            validated_sql = self._validate_sql(generated_sql)
+        except ValueError:
+            generated_sql = await self._request_completion(
+                self.model, system_blocks, natural_language_query
             )
+            validated_sql = self._validate_sql(generated_sql)
 
-            if response.status_code != 200:
-                error_detail = response.text
-                raise ValueError(
-                    f"Claude API error (status {response.status_code}): {error_detail}"
-                )
+        if len(self._sql_cache) >= self.SQL_CACHE_MAX:
+            self._sql_cache.pop(next(iter(self._sql_cache)))
+        self._sql_cache[cache_key] = (time.monotonic(), validated_sql)
 
-            data = response.json()
-            generated_sql = data["content"][0]["text"]
+        return validated_sql
 
-        # Validate the SQL
-        validated_sql = self._validate_sql(generated_sql)
+    async def generate_sql_batch(
+        self,
+        requests: List[Tuple[str, Dict[str, Any]]],
+    ) -> List[str]:
+        """
+        Convert several natural language queries to SQL concurrently.
 
-        return validated_sql
+        A dashboard load fires one NL query per widget; issuing them
+        sequentially pays N full Claude round-trips. Here the calls run
+        concurrently and multiplex over the shared HTTP/2 connection, so
+        the wall-clock cost is roughly one round-trip, and widgets that
+        share a data source reuse the same prompt-cached schema prefix.
+        Duplicate (query, schema) pairs collapse to a single API call.
+
+        Args:
+            requests: List of (natural_language_query, schema) pairs
+
+        Returns:
+            Generated SQL strings in input order
+
+        Raises:
+            ValueError: If any generation or validation fails
+        """
+        unique: Dict[Tuple[str, str], int] = {}
+        coros = []
+        for nl_query, schema in requests:
+            key = (nl_query.strip().lower(), self._schema_hash(schema))
+            if key not in unique:
+                unique[key] = len(coros)
+                coros.append(self.generate_sql(nl_query, schema))
+
+        results = await asyncio.gather(*coros)
+
+        return [
+            results[unique[(nl_query.strip().lower(), self._schema_hash(schema))]]
+            for nl_query, schema in requests
+        ]
@@ -147,9 +147,20 @@ class TestQueryModel:
         assert "generated_sql" in columns
         assert "user_id" in columns
         assert "data_source_id" in columns
-        assert "execution_time_ms" in columns
         assert "is_favorite" in columns
 
+    def test_query_execution_holds_telemetry(self):
+        """Test execution telemetry lives in the cold QueryExecution table."""
+        from app.models.query import QueryExecution
+
+        assert QueryExecution.__tablename__ == "query_executions"
+
+        columns = {c.name for c in QueryExecution.__table__.columns}
+        assert "query_id" in columns
+        assert "execution_time_ms" in columns
+        assert "result_rows_count" in columns
+        assert "error_message" in columns
+
 
 class TestDashboardModel:
     """Test cases for Dashboard model."""